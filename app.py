@@ -2,10 +2,13 @@
 
 import streamlit as st
 import asyncio
-import json
+import atexit
+import concurrent.futures
 import os
+import threading
 from datetime import datetime
 import logging
+from typing import Dict, Any
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -22,9 +25,10 @@ from core.cache import CacheManager
 from core.metrics import MetricsTracker
 
 from utils.validators import validate_text_length, get_character_count_display
+from utils.formatters import result_to_json
 
 from components.verdict_display import display_verdict
-from components.model_scores import display_model_scores, display_model_agreement
+from components.model_scores import display_model_scores, display_model_agreement, sort_model_scores
 from components.indicators import display_indicators, display_indicator_summary
 
 st.set_page_config(
@@ -39,27 +43,79 @@ st.set_page_config(
     }
 )
 
-from components.shared_styles import inject_styles
+from components.shared_styles import inject_styles, render_sidebar_branding, render_page_header
 inject_styles()
 
-def init_session_state():
+@st.cache_resource
+def load_config() -> Config:
     
+    try:
+        return Config.from_secrets(st.secrets)
+    except Exception as e:
+        logger.warning(f"Could not load secrets, using defaults: {e}")
+        return Config()
+
+@st.cache_resource
+def get_ensemble() -> EnsemblePredictor:
     
-    if 'config' not in st.session_state:
-        try:
-            st.session_state.config = Config.from_secrets(st.secrets)
-        except Exception as e:
-            logger.warning(f"Could not load secrets, using defaults: {e}")
-            st.session_state.config = Config()
+    ensemble = EnsemblePredictor(load_config())
+    atexit.register(shutdown_ensemble, ensemble, get_event_loop())
+    return ensemble
+
+def shutdown_ensemble(ensemble: EnsemblePredictor, loop: asyncio.AbstractEventLoop) -> None:
     
-    if 'ensemble' not in st.session_state:
-        st.session_state.ensemble = EnsemblePredictor(st.session_state.config)
+    if not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(ensemble.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close HTTP session: {e}")
+
+@st.cache_resource
+def get_cache_manager(ttl_hours: int) -> CacheManager:
     
-    if 'cache_manager' not in st.session_state:
-        st.session_state.cache_manager = CacheManager(
-            cache_file="cache.json",
-            ttl_hours=st.session_state.config.cache_ttl_hours
-        )
+    return CacheManager(cache_file="cache.json", ttl_hours=ttl_hours)
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="ensemble-loop", daemon=True).start()
+    return loop
+
+def run_async(coro, timeout: float = 60):
+    
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Analysis took longer than {timeout:g} seconds") from None
+
+def analyze_article(text: str) -> Dict[str, Any]:
+    
+    cache_manager = st.session_state.cache_manager
+    
+    cached_result = cache_manager.get(text)
+    if cached_result:
+        return cached_result
+    
+    result = run_async(st.session_state.ensemble.predict(text))
+    result['cached'] = False
+    cache_manager.set(text, result)
+    return result
+
+@st.cache_data(ttl=1.0, show_spinner=False)
+def get_cache_stats(_cache_manager: CacheManager) -> Dict[str, Any]:
+    
+    return _cache_manager.stats()
+
+def init_session_state():
+    
+    
+    st.session_state.config = load_config()
+    st.session_state.ensemble = get_ensemble()
+    st.session_state.cache_manager = get_cache_manager(st.session_state.config.cache_ttl_hours)
     
     if 'metrics_tracker' not in st.session_state:
         st.session_state.metrics_tracker = MetricsTracker()
@@ -78,22 +134,25 @@ def init_session_state():
 
 init_session_state()
 
+QUOTA_ROW_TEMPLATE = (
+    '<div class="quota-row">{label}: {used}/{total}'
+    '<div class="quota-track"><div class="quota-fill" style="width: {percentage:.1f}%;"></div></div>'
+    '</div>'
+)
+
+QUOTA_MISSING_TEMPLATE = '<div class="quota-row quota-missing">{label}: {text}</div>'
+
 def render_sidebar():
     
     
     with st.sidebar:
-        st.markdown('''
-        <div class="sidebar-branding">
-            <span class="sidebar-logo" style="font-size: 1.8rem;">⊹</span>
-            <span>Fake News Detector</span>
-        </div>
-        ''', unsafe_allow_html=True)
+        render_sidebar_branding()
         
         st.divider()
         
         st.metric("Total Analyses", st.session_state.total_predictions)
         
-        cache_stats = st.session_state.cache_manager.stats()
+        cache_stats = get_cache_stats(st.session_state.cache_manager)
         st.metric("Cache Hit Rate", f"{cache_stats['hit_rate']:.1%}")
         st.caption(f"Cached entries: {cache_stats['total_entries']}")
         
@@ -111,45 +170,44 @@ def render_sidebar():
         
         st.subheader("Quota Usage")
         
-        if st.session_state.config.has_hf_key():
-            hf_usage = st.session_state.ensemble.hf_client.get_quota_usage()
-            st.progress(
-                hf_usage['percentage'] / 100,
-                text=f"HuggingFace: {hf_usage['used']}/{hf_usage['total']}"
-            )
-        else:
-            st.caption("HuggingFace: No API key")
+        config = st.session_state.config
+        ensemble = st.session_state.ensemble
+        quota_sources = (
+            ("HuggingFace", config.has_hf_key(), ensemble.hf_client, "No API key"),
+            ("Gemini", config.has_gemini_key(), ensemble.gemini_client, "No API key"),
+            ("Groq", config.has_groq_key(), ensemble.groq_client, "No API key (fallback)")
+        )
         
-        if st.session_state.config.has_gemini_key():
-            gemini_usage = st.session_state.ensemble.gemini_client.get_quota_usage()
-            st.progress(
-                gemini_usage['percentage'] / 100,
-                text=f"Gemini: {gemini_usage['used']}/{gemini_usage['total']}"
-            )
-        else:
-            st.caption("Gemini: No API key")
+        quota_rows = []
+        for label, has_key, client, missing_text in quota_sources:
+            if has_key:
+                usage = client.get_quota_usage()
+                quota_rows.append(QUOTA_ROW_TEMPLATE.format(
+                    label=label,
+                    used=usage['used'],
+                    total=usage['total'],
+                    percentage=min(usage['percentage'], 100)
+                ))
+            else:
+                quota_rows.append(QUOTA_MISSING_TEMPLATE.format(label=label, text=missing_text))
         
-        if st.session_state.config.has_groq_key():
-            groq_usage = st.session_state.ensemble.groq_client.get_quota_usage()
-            st.progress(
-                groq_usage['percentage'] / 100,
-                text=f"Groq: {groq_usage['used']}/{groq_usage['total']}"
-            )
-        else:
-            st.caption("Groq: No API key (fallback)")
+        st.markdown("".join(quota_rows), unsafe_allow_html=True)
         
         st.markdown("---")
         
         st.subheader("Session")
         session_info = st.session_state.metrics_tracker.get_session_info()
-        st.caption(f"Uptime: {session_info['uptime']}")
-        st.caption(f"Rate: {session_info['predictions_per_hour']:.1f}/hr")
+        st.caption(
+            f"Uptime: {session_info['uptime']}  \n"
+            f"Rate: {session_info['predictions_per_hour']:.1f}/hr"
+        )
 
 render_sidebar()
 
-st.markdown('<div class="logo-symbol">⊹</div>', unsafe_allow_html=True)
-st.markdown('<h1 class="main-header">Fake News Detection AI</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Production-grade multi-model analysis powered by AI ensemble</p>', unsafe_allow_html=True)
+render_page_header(
+    "Fake News Detection AI",
+    "Production-grade multi-model analysis powered by AI ensemble"
+)
 
 st.markdown('''
 <div class="info-card">
@@ -169,34 +227,38 @@ article_text = st.text_area(
     help="Paste the full text of the news article. The system analyzes text patterns, not URLs."
 )
 
-col1, col2 = st.columns(2)
-with col1:
-    article_url = st.text_input(
-        "Article URL (optional)",
-        placeholder="https://example.com/article",
-        help="For reference only - not used in analysis"
-    )
-with col2:
-    source_name = st.text_input(
-        "Source Name (optional)",
-        placeholder="e.g., CNN, BBC, Fox News",
-        help="For reference only - not used in analysis"
-    )
+@st.fragment
+def render_reference_inputs():
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.text_input(
+            "Article URL (optional)",
+            key="article_url",
+            placeholder="https://example.com/article",
+            help="For reference only - not used in analysis"
+        )
+    with col2:
+        st.text_input(
+            "Source Name (optional)",
+            key="source_name",
+            placeholder="e.g., CNN, BBC, Fox News",
+            help="For reference only - not used in analysis"
+        )
+
+render_reference_inputs()
 
-char_count = len(article_text) if article_text else 0
 display_text, status = get_character_count_display(
     article_text,
     st.session_state.config.max_text_length
 )
 
-if status == "empty":
-    st.caption(display_text)
-elif status == "short":
-    st.warning(display_text)
-elif status == "valid":
-    st.success(display_text)
-else:
-    st.error(display_text)
+STATUS_DISPLAY = {
+    "empty": st.caption,
+    "short": st.warning,
+    "valid": st.success
+}
+STATUS_DISPLAY.get(status, st.error)(display_text)
 
 is_valid, validation_msg = validate_text_length(
     article_text,
@@ -212,58 +274,29 @@ analyze_clicked = st.button(
 )
 
 if analyze_clicked and is_valid:
-    cached_result = st.session_state.cache_manager.get(article_text)
+    with st.spinner("Analyzing with AI models..."):
+        try:
+            result = analyze_article(article_text)
+            
+            st.session_state.current_result = result
+            
+        except Exception as e:
+            logger.error(f"Analysis failed: {e}")
+            st.error(f"Analysis failed: {str(e)}")
+            st.info("**Troubleshooting tips:**\n- Check your internet connection\n- Verify API keys in settings\n- Try with shorter text")
+            st.session_state.metrics_tracker.record_error(e, "ensemble")
+            st.stop()
     
-    if cached_result:
+    if result.get('cached'):
         st.info("**Retrieved from cache** - Instant result!")
-        result = cached_result
-        result['cached'] = True
-        st.session_state.current_result = result
-    else:
-        with st.spinner("Analyzing with AI models..."):
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            try:
-                start_time = datetime.now()
-                
-                status_text.text("Running heuristic analysis...")
-                progress_bar.progress(20)
-                
-                status_text.text("Querying HuggingFace models...")
-                progress_bar.progress(40)
-                
-                status_text.text("Querying Gemini/Groq LLM...")
-                progress_bar.progress(60)
-                
-                result = asyncio.run(
-                    st.session_state.ensemble.predict(article_text)
-                )
-                
-                status_text.text("Aggregating results...")
-                progress_bar.progress(80)
-                
-                result['cached'] = False
-                
-                st.session_state.cache_manager.set(article_text, result)
-                
-                progress_bar.progress(100)
-                status_text.text("Analysis complete!")
-                
-                st.session_state.current_result = result
-                
-            except Exception as e:
-                logger.error(f"Analysis failed: {e}")
-                st.error(f"Analysis failed: {str(e)}")
-                st.info("**Troubleshooting tips:**\n- Check your internet connection\n- Verify API keys in settings\n- Try with shorter text")
-                st.session_state.metrics_tracker.record_error(e, "ensemble")
-                st.stop()
     
     st.session_state.metrics_tracker.record_prediction(result, article_text)
     st.session_state.predictions_history.insert(0, result)
     st.session_state.total_predictions += 1
 
-if st.session_state.current_result:
+@st.fragment
+def render_results():
+    
     result = st.session_state.current_result
     
     st.divider()
@@ -272,9 +305,9 @@ if st.session_state.current_result:
     display_verdict(result)
     
     with st.expander("Model Scores Breakdown", expanded=True):
-        model_scores = result.get('model_scores', [])
-        display_model_scores(model_scores)
-        display_model_agreement(model_scores)
+        model_scores = sort_model_scores(result.get('model_scores', []))
+        display_model_scores(model_scores, presorted=True)
+        display_model_agreement(model_scores, presorted=True)
     
     with st.expander("Detection Indicators", expanded=True):
         indicator_details = result.get('indicator_details', [])
@@ -306,7 +339,7 @@ if st.session_state.current_result:
     with col1:
         st.download_button(
             label="Download Report (JSON)",
-            data=json.dumps(result, indent=2, default=str),
+            data=result_to_json(result),
             file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
@@ -323,5 +356,8 @@ if st.session_state.current_result:
         f"{result.get('timestamp', 'N/A')}"
     )
 
+if st.session_state.current_result:
+    render_results()
+
 st.divider()
 st.caption("Disclaimer: This tool provides AI-assisted analysis. Always verify information through multiple trusted sources.")
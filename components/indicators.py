@@ -30,6 +30,22 @@ INDICATOR_INFO = {
     }
 }
 
+SEVERITY_COLORS = {
+    'LOW': ('#d1fae5', '#065f46', 'L'),
+    'MEDIUM': ('#fef3c7', '#92400e', 'M'),
+    'HIGH': ('#fee2e2', '#991b1b', 'H')
+}
+
+_INDICATOR_KEYS = {key: key for key in INDICATOR_INFO}
+_INDICATOR_KEYS.update({info['name']: key for key, info in INDICATOR_INFO.items()})
+
+def _indicator_key(name: str) -> str:
+    
+    key = _INDICATOR_KEYS.get(name)
+    if key is None:
+        key = name.lower().replace(' ', '_')
+    return key
+
 def display_indicators(indicator_details: List[Dict[str, Any]]) -> None:
     
     if not indicator_details:
@@ -52,20 +68,14 @@ def _render_indicator_card(indicator: Dict[str, Any]) -> None:
     description = indicator.get('description', '')
     matches = indicator.get('matches', [])
     
-    key = name.lower().replace(' ', '_')
-    info = INDICATOR_INFO.get(key, {
+    info = INDICATOR_INFO.get(_indicator_key(name), {
         'icon': '',
         'name': name,
         'description': description,
         'tooltip': ''
     })
     
-    severity_colors = {
-        'LOW': ('#d1fae5', '#065f46', 'L'),
-        'MEDIUM': ('#fef3c7', '#92400e', 'M'),
-        'HIGH': ('#fee2e2', '#991b1b', 'H')
-    }
-    bg_color, text_color, badge = severity_colors.get(severity, severity_colors['LOW'])
+    bg_color, text_color, badge = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['LOW'])
     
     st.markdown(f, unsafe_allow_html=True)
     
@@ -85,8 +95,7 @@ def display_indicators_compact(indicators: Dict[str, float]) -> None:
     cols = st.columns(len(indicators))
     
     for idx, (name, score) in enumerate(indicators.items()):
-        key = name.lower().replace(' ', '_')
-        info = INDICATOR_INFO.get(key, {'icon': '', 'name': name})
+        info = INDICATOR_INFO.get(_indicator_key(name), {'icon': '', 'name': name})
         
         with cols[idx]:
             st.metric(
@@ -1,130 +1,107 @@
 
 
 import streamlit as st
-import pandas as pd
 from typing import Dict, Any, List
 
-def display_model_scores(model_scores: List[Dict[str, Any]]) -> None:
+from utils.formatters import format_latency
+
+MODEL_NAMES = {
+    'heuristic': ('Heuristic', 'Rule-based pattern detection'),
+    'huggingface': ('HuggingFace', 'Sentiment-based classifier'),
+    'gemini': ('Gemini', 'LLM-based analysis'),
+    'groq': ('Groq', 'LLM fallback')
+}
+
+SCORE_COLUMN_CONFIG = {
+    'Model': st.column_config.TextColumn('Model', width='medium'),
+    'Description': st.column_config.TextColumn('Description', width='medium'),
+    'Fake Probability': st.column_config.ProgressColumn(
+        'Fake Probability', min_value=0, max_value=100, format='%.1f%%'
+    ),
+    'Confidence': st.column_config.ProgressColumn(
+        'Confidence', min_value=0, max_value=100, format='%.1f%%'
+    ),
+    'Time': st.column_config.TextColumn('Time', width='small'),
+    'Weight': st.column_config.NumberColumn('Weight', format='%.0f%%', width='small')
+}
+
+def sort_model_scores(model_scores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    
+    return sorted(
+        model_scores,
+        key=lambda x: x.get('fake_probability', 0.5),
+        reverse=True
+    )
+
+def display_model_scores(
+    model_scores: List[Dict[str, Any]],
+    presorted: bool = False
+) -> None:
     
     if not model_scores:
         st.info("No model scores available.")
         return
     
-    model_names = {
-        'heuristic': ('Heuristic', 'Rule-based pattern detection'),
-        'huggingface': ('HuggingFace', 'Sentiment-based classifier'),
-        'gemini': ('Gemini', 'LLM-based analysis'),
-        'groq': ('Groq', 'LLM fallback')
-    }
-    
     st.caption(f"Analyzed by {len(model_scores)} model(s)")
     
-    cols = st.columns([3, 2, 2, 1.5, 1])
-    with cols[0]:
-        st.markdown("**Model**")
-    with cols[1]:
-        st.markdown("**Fake Probability**")
-    with cols[2]:
-        st.markdown("**Confidence**")
-    with cols[3]:
-        st.markdown("**Time**")
-    with cols[4]:
-        st.markdown("**Weight**")
-    
-    st.divider()
+    sorted_scores = model_scores if presorted else sort_model_scores(model_scores)
+    display_info = [
+        MODEL_NAMES.get(name, (name.title(), 'Unknown model'))
+        for name in (score.get('model_name', 'unknown') for score in sorted_scores)
+    ]
+    
+    table = {
+        'Model': [info[0] for info in display_info],
+        'Description': [info[1] for info in display_info],
+        'Fake Probability': [score.get('fake_probability', 0.5) * 100 for score in sorted_scores],
+        'Confidence': [score.get('confidence', 0.5) * 100 for score in sorted_scores],
+        'Time': [format_latency(score.get('processing_time', 0)) for score in sorted_scores],
+        'Weight': [score.get('weight', 0.1) * 100 for score in sorted_scores]
+    }
     
-    sorted_scores = sorted(
-        model_scores,
-        key=lambda x: x.get('fake_probability', 0),
-        reverse=True
+    st.dataframe(
+        table,
+        column_config=SCORE_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True
     )
-    
-    for score in sorted_scores:
-        model_name = score.get('model_name', 'unknown')
-        fake_prob = score.get('fake_probability', 0.5)
-        confidence = score.get('confidence', 0.5)
-        proc_time = score.get('processing_time', 0)
-        weight = score.get('weight', 0.1)
-        
-        display_info = model_names.get(model_name, (model_name.title(), 'Unknown model'))
-        
-        cols = st.columns([3, 2, 2, 1.5, 1])
-        
-        with cols[0]:
-            st.markdown(f"**{display_info[0]}**")
-            st.caption(display_info[1])
-        
-        with cols[1]:
-            color = _get_probability_color(fake_prob)
-            st.markdown(
-                f"<span style='color: {color}; font-weight: bold;'>"
-                f"{fake_prob * 100:.1f}%</span>",
-                unsafe_allow_html=True
-            )
-            st.progress(fake_prob)
-        
-        with cols[2]:
-            st.markdown(f"{confidence * 100:.1f}%")
-            st.progress(confidence)
-        
-        with cols[3]:
-            if proc_time < 0.001:
-                st.markdown("<1ms")
-            elif proc_time < 1:
-                st.markdown(f"{proc_time * 1000:.0f}ms")
-            else:
-                st.markdown(f"{proc_time:.2f}s")
-        
-        with cols[4]:
-            st.markdown(f"{weight * 100:.0f}%")
-        
-        st.divider()
 
 def display_model_scores_compact(model_scores: List[Dict[str, Any]]) -> None:
     
     if not model_scores:
         return
     
-    df = pd.DataFrame(model_scores)
-    
-    df['Fake %'] = df['fake_probability'].apply(lambda x: f"{x * 100:.1f}%")
-    df['Conf %'] = df['confidence'].apply(lambda x: f"{x * 100:.1f}%")
-    df['Time'] = df['processing_time'].apply(
-        lambda x: f"{x * 1000:.0f}ms" if x < 1 else f"{x:.2f}s"
-    )
-    df['Weight'] = df.get('weight', pd.Series([0.1] * len(df))).apply(
-        lambda x: f"{x * 100:.0f}%"
-    )
-    
-    model_icons = {'heuristic': '', 'huggingface': '', 'gemini': '', 'groq': ''}
-    df['Model'] = df['model_name'].apply(
-        lambda x: x.title()
-    )
-    
-    display_df = df[['Model', 'Fake %', 'Conf %', 'Time', 'Weight']]
+    table = {
+        'Model': [score['model_name'].title() for score in model_scores],
+        'Fake %': [f"{score['fake_probability'] * 100:.1f}%" for score in model_scores],
+        'Conf %': [f"{score['confidence'] * 100:.1f}%" for score in model_scores],
+        'Time': [
+            f"{t * 1000:.0f}ms" if t < 1 else f"{t:.2f}s"
+            for t in (score['processing_time'] for score in model_scores)
+        ],
+        'Weight': [f"{score.get('weight', 0.1) * 100:.0f}%" for score in model_scores]
+    }
     
     st.dataframe(
-        display_df,
+        table,
         use_container_width=True,
         hide_index=True
     )
 
-def _get_probability_color(prob: float) -> str:
-    
-    if prob >= 0.7:
-        return '#ef4444'
-    elif prob >= 0.3:
-        return '#f59e0b'
-    else:
-        return '#10b981'
-
-def display_model_agreement(model_scores: List[Dict[str, Any]]) -> None:
+def display_model_agreement(
+    model_scores: List[Dict[str, Any]],
+    presorted: bool = False
+) -> None:
     
     if len(model_scores) < 2:
         return
     
-    probs = [s.get('fake_probability', 0.5) for s in model_scores]
-    min_prob, max_prob = min(probs), max(probs)
+    if presorted:
+        max_prob = model_scores[0].get('fake_probability', 0.5)
+        min_prob = model_scores[-1].get('fake_probability', 0.5)
+    else:
+        probs = [s.get('fake_probability', 0.5) for s in model_scores]
+        min_prob, max_prob = min(probs), max(probs)
     spread = max_prob - min_prob
     
     if spread < 0.1:
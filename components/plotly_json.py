@@ -0,0 +1,10 @@
+
+
+import importlib.util
+
+import plotly.io as pio
+
+def use_orjson_engine() -> None:
+    
+    if importlib.util.find_spec("orjson") is not None:
+        pio.json.config.default_engine = "orjson"
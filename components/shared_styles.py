@@ -1,3 +1,5 @@
+import re
+
 SHARED_CSS = """
 <style>
     .stApp {
@@ -99,6 +101,28 @@ SHARED_CSS = """
         text-align: center;
     }
     
+    .quota-row {
+        font-size: 0.875rem;
+        margin-bottom: 0.75rem;
+    }
+    
+    .quota-missing {
+        color: #808495;
+    }
+    
+    .quota-track {
+        background: rgba(0, 131, 143, 0.12);
+        border-radius: 4px;
+        height: 6px;
+        margin-top: 4px;
+    }
+    
+    .quota-fill {
+        background: #00838f;
+        border-radius: 4px;
+        height: 100%;
+    }
+    
     .info-card {
         background: rgba(0, 131, 143, 0.03);
         border: 1px solid rgba(0, 131, 143, 0.1);
@@ -112,15 +136,38 @@ SHARED_CSS = """
 </style>
 """
 
+SIDEBAR_BRANDING_HTML = """
+<div class="sidebar-branding">
+    <span class="sidebar-logo" style="font-size: 1.8rem;">⊹</span>
+    <span>Fake News Detector</span>
+</div>
+"""
+
+PAGE_HEADER_TEMPLATE = (
+    '<div class="logo-symbol">⊹</div>'
+    '<h1 class="main-header">{title}</h1>'
+    '<p class="sub-header">{subtitle}</p>'
+)
+
+def _minify(markup: str) -> str:
+    
+    markup = re.sub(r"\s+", " ", markup)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", markup).strip()
+
+_SHARED_CSS_MIN = _minify(SHARED_CSS)
+_SIDEBAR_BRANDING_MIN = _minify(SIDEBAR_BRANDING_HTML)
+
 def inject_styles():
     import streamlit as st
-    st.markdown(SHARED_CSS, unsafe_allow_html=True)
+    st.markdown(_SHARED_CSS_MIN, unsafe_allow_html=True)
 
 def render_sidebar_branding():
     import streamlit as st
-    st.markdown("""
-    <div class="sidebar-branding">
-        <span class="sidebar-logo" style="font-size: 1.8rem;">⊹</span>
-        <span>Fake News Detector</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SIDEBAR_BRANDING_MIN, unsafe_allow_html=True)
+
+def render_page_header(title: str, subtitle: str):
+    import streamlit as st
+    st.markdown(
+        PAGE_HEADER_TEMPLATE.format(title=title, subtitle=subtitle),
+        unsafe_allow_html=True
+    )
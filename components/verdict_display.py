@@ -4,52 +4,68 @@ import streamlit as st
 import plotly.graph_objects as go
 from typing import Dict, Any
 
-def display_verdict(result: Dict[str, Any]) -> None:
-    
-    prediction = result.get("prediction", "UNCERTAIN")
-    confidence = result.get("confidence", 0.5)
-    fake_prob = result.get("fake_probability", 0.5)
-    processing_time = result.get("processing_time", 0)
-    
-    colors = {
-        'FAKE': {
-            'bg': '#fee2e2',
-            'border': '#ef4444',
-            'text': '#991b1b',
-            'icon': '❌',
-            'label': 'LIKELY FAKE NEWS'
-        },
-        'REAL': {
-            'bg': '#d1fae5',
-            'border': '#10b981',
-            'text': '#065f46',
-            'icon': '✅',
-            'label': 'LIKELY AUTHENTIC'
-        },
-        'UNCERTAIN': {
-            'bg': '#fef3c7',
-            'border': '#f59e0b',
-            'text': '#92400e',
-            'icon': '⚠️',
-            'label': 'UNCERTAIN - NEEDS VERIFICATION'
-        }
+from components.plotly_json import use_orjson_engine
+
+use_orjson_engine()
+
+VERDICT_STYLES = {
+    'FAKE': {
+        'bg': '#fee2e2',
+        'border': '#ef4444',
+        'text': '#991b1b',
+        'icon': '❌',
+        'label': 'LIKELY FAKE NEWS'
+    },
+    'REAL': {
+        'bg': '#d1fae5',
+        'border': '#10b981',
+        'text': '#065f46',
+        'icon': '✅',
+        'label': 'LIKELY AUTHENTIC'
+    },
+    'UNCERTAIN': {
+        'bg': '#fef3c7',
+        'border': '#f59e0b',
+        'text': '#92400e',
+        'icon': '⚠️',
+        'label': 'UNCERTAIN - NEEDS VERIFICATION'
     }
-    
-    color = colors.get(prediction, colors['UNCERTAIN'])
-    
-    st.markdown(f"""
+}
+
+VERDICT_BANNER_TEMPLATE = """
     <div style="
-        background: {color['bg']};
-        border: 2px solid {color['border']};
+        background: {bg};
+        border: 2px solid {border};
         border-radius: 12px;
         padding: 20px;
         text-align: center;
         margin: 20px 0;
     ">
-        <span style="font-size: 3rem;">{color['icon']}</span>
-        <h2 style="color: {color['text']}; margin: 10px 0;">{color['label']}</h2>
+        <span style="font-size: 3rem;">{icon}</span>
+        <h2 style="color: {text}; margin: 10px 0;">{label}</h2>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+VERDICT_BANNERS = {
+    prediction: VERDICT_BANNER_TEMPLATE.format(**style)
+    for prediction, style in VERDICT_STYLES.items()
+}
+
+QUICK_VERDICT_ICONS = {'FAKE': '❌', 'REAL': '✅', 'UNCERTAIN': '⚠️'}
+QUICK_VERDICT_COLORS = {'FAKE': 'red', 'REAL': 'green', 'UNCERTAIN': 'orange'}
+
+def display_verdict(result: Dict[str, Any]) -> None:
+    
+    prediction = result.get("prediction", "UNCERTAIN")
+    confidence = result.get("confidence", 0.5)
+    fake_prob = result.get("fake_probability", 0.5)
+    processing_time = result.get("processing_time", 0)
+    
+    if prediction not in VERDICT_STYLES:
+        prediction = 'UNCERTAIN'
+    color = VERDICT_STYLES[prediction]
+    
+    st.markdown(VERDICT_BANNERS[prediction], unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
     
@@ -85,9 +101,16 @@ def display_verdict(result: Dict[str, Any]) -> None:
 
 def _display_probability_gauge(fake_prob: float, accent_color: str) -> None:
     
+    spec = _probability_gauge_spec(accent_color)
+    spec['data'][0]['value'] = fake_prob * 100
+    st.plotly_chart(go.Figure(spec), use_container_width=True)
+
+@st.cache_data(max_entries=len(VERDICT_STYLES), show_spinner=False)
+def _probability_gauge_spec(accent_color: str) -> Dict[str, Any]:
+    
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
-        value=fake_prob * 100,
+        value=0,
         domain={'x': [0, 1], 'y': [0, 1]},
         title={'text': "Fake News Probability", 'font': {'size': 18}},
         number={'suffix': '%', 'font': {'size': 40}},
@@ -117,18 +140,15 @@ def _display_probability_gauge(fake_prob: float, accent_color: str) -> None:
         plot_bgcolor='rgba(0,0,0,0)'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
 
 def display_quick_verdict(result: Dict[str, Any]) -> None:
     
     prediction = result.get("prediction", "UNCERTAIN")
     fake_prob = result.get("fake_probability", 0.5)
     
-    icons = {'FAKE': '❌', 'REAL': '✅', 'UNCERTAIN': '⚠️'}
-    colors = {'FAKE': 'red', 'REAL': 'green', 'UNCERTAIN': 'orange'}
-    
     st.markdown(
-        f"<span style='color: {colors.get(prediction, 'gray')}'>"
-        f"{icons.get(prediction, '❓')} {prediction} ({fake_prob*100:.0f}%)</span>",
+        f"<span style='color: {QUICK_VERDICT_COLORS.get(prediction, 'gray')}'>"
+        f"{QUICK_VERDICT_ICONS.get(prediction, '❓')} {prediction} ({fake_prob*100:.0f}%)</span>",
         unsafe_allow_html=True
     )
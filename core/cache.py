@@ -1,19 +1,59 @@
 
 
+import atexit
 import hashlib
+import heapq
 import json
 import os
 import time
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from threading import Lock
+import mmap
+import weakref
+from datetime import datetime
+from itertools import chain
+from typing import Dict, Any, List, Optional, Union
+from threading import Lock, Timer, current_thread, local
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .timestamps import iso_timestamp
 
 logger = logging.getLogger(__name__)
 
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+def _dumps(obj: Any) -> bytes:
+    
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: Union[bytes, memoryview]) -> Any:
+    
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
 class CacheManager:
     
     
+    COMPACT_MIN_ENTRIES = 64
+    LOG_SYNC_BYTES = 256 * 1024
+    MIN_CLEANUP_INTERVAL = 60.0
+    SHARD_COUNT = 64
+    
     def __init__(
         self,
         cache_file: str = "cache.json",
@@ -21,135 +61,376 @@ class CacheManager:
     ):
         
         self.cache_file = cache_file
+        self.log_file = f"{cache_file}.log"
         self.ttl_hours = ttl_hours
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.hits = 0
-        self.misses = 0
-        self._lock = Lock()
+        self._shards: List[Dict[str, Dict[str, Any]]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._locks: List[Lock] = [Lock() for _ in range(self.SHARD_COUNT)]
+        self._io_lock = Lock()
+        self._hits: List[int] = [0] * self.SHARD_COUNT
+        self._misses: List[int] = [0] * self.SHARD_COUNT
+        self._local = local()
+        self._thread_hits: List[tuple] = []
+        self._retired_hits = 0
+        self._dirty = False
+        self._log_entries = 0
+        self._log_unsynced_bytes = 0
+        self._log_handle = None
+        self._cleanup_timer: Optional[Timer] = None
         
         self._load_cache()
         
         self._cleanup_expired()
+        self._schedule_cleanup()
+        
+        atexit.register(CacheManager._flush_at_exit, weakref.ref(self))
+        
+        logger.info(f"CacheManager initialized with {self._entry_count()} entries, TTL={ttl_hours}h")
+    
+    @property
+    def cache(self) -> Dict[str, Dict[str, Any]]:
+        
+        merged: Dict[str, Dict[str, Any]] = {}
+        for shard in self._shards:
+            merged.update(shard)
+        return merged
+    
+    @cache.setter
+    def cache(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        
+        shards: List[Dict[str, Dict[str, Any]]] = [{} for _ in range(self.SHARD_COUNT)]
+        for key, entry in entries.items():
+            shards[self._shard_index(key)][key] = entry
+        self._shards = shards
+    
+    @property
+    def hits(self) -> int:
+        
+        return (
+            sum(self._hits)
+            + self._retired_hits
+            + sum(counter[0] for _, counter in self._thread_hits)
+        )
+    
+    def _thread_hit_counter(self) -> List[int]:
+        
+        counter = getattr(self._local, 'hits', None)
+        if counter is None:
+            counter = [0]
+            self._local.hits = counter
+            with self._io_lock:
+                live = []
+                for thread_ref, thread_counter in self._thread_hits:
+                    if thread_ref() is None:
+                        self._retired_hits += thread_counter[0]
+                    else:
+                        live.append((thread_ref, thread_counter))
+                live.append((weakref.ref(current_thread()), counter))
+                self._thread_hits = live
+        return counter
+    
+    @property
+    def misses(self) -> int:
         
-        logger.info(f"CacheManager initialized with {len(self.cache)} entries, TTL={ttl_hours}h")
+        return sum(self._misses)
+    
+    def _shard_index(self, key: str) -> int:
+        
+        try:
+            return int(key[:2], 16) & (self.SHARD_COUNT - 1)
+        except ValueError:
+            return hash(key) & (self.SHARD_COUNT - 1)
+    
+    def _entry_count(self) -> int:
+        
+        return sum(len(shard) for shard in self._shards)
+    
+    def _acquire_all(self) -> None:
+        
+        for lock in self._locks:
+            lock.acquire()
+    
+    def _release_all(self) -> None:
+        
+        for lock in reversed(self._locks):
+            lock.release()
     
     def _generate_key(self, text: str) -> str:
         
-        normalized = text.lower().strip()
-        hash_obj = hashlib.md5(normalized.encode('utf-8'))
-        return hash_obj.hexdigest()[:12]
+        normalized = text.lower().strip().encode('utf-8')
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh64_hexdigest(normalized)[:12]
+        return hashlib.blake2b(normalized, digest_size=6).hexdigest()
     
     def _load_cache(self) -> None:
         
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.cache = json.load(f)
-                logger.debug(f"Loaded {len(self.cache)} entries from cache file")
-        except (json.JSONDecodeError, IOError) as e:
+            if os.path.exists(self.cache_file) and os.path.getsize(self.cache_file) > 0:
+                with open(self.cache_file, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as view:
+                            self.cache = _loads(view)
+                logger.debug(f"Loaded {self._entry_count()} entries from cache file")
+        except (ValueError, IOError) as e:
             logger.warning(f"Failed to load cache file: {e}")
             self.cache = {}
+        
+        replayed = self._replay_log()
+        self._backfill_expiry()
+        
+        if replayed > 0:
+            self._dirty = True
+            self._flush_locked()
     
-    def _save_cache(self) -> None:
+    def _replay_log(self) -> int:
+        
+        replayed = 0
+        if not os.path.exists(self.log_file):
+            return replayed
         
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, default=str)
-            logger.debug(f"Saved {len(self.cache)} entries to cache file")
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        logger.warning("Skipping corrupt cache log record")
+                        continue
+                    key = record['key']
+                    self._shards[self._shard_index(key)][key] = record['entry']
+                    replayed += 1
         except IOError as e:
+            logger.warning(f"Failed to replay cache log: {e}")
+        
+        if replayed > 0:
+            logger.debug(f"Replayed {replayed} entries from cache log")
+        return replayed
+    
+    def _backfill_expiry(self) -> None:
+        
+        ttl_seconds = self.ttl_hours * 3600
+        for shard in self._shards:
+            for entry in shard.values():
+                if 'expires_at' in entry:
+                    continue
+                try:
+                    created = datetime.fromisoformat(entry['timestamp']).timestamp()
+                    entry['expires_at'] = created + ttl_seconds
+                except (KeyError, ValueError, TypeError):
+                    entry['expires_at'] = 0.0
+    
+    def _append_log(self, key: str, entry: Dict[str, Any]) -> None:
+        
+        with self._io_lock:
+            try:
+                if self._log_handle is None:
+                    self._log_handle = open(self.log_file, 'ab')
+                record = _dumps({'key': key, 'entry': entry}) + b'\n'
+                self._log_handle.write(record)
+                self._log_handle.flush()
+                self._log_entries += 1
+                self._log_unsynced_bytes += len(record)
+                if self._log_unsynced_bytes >= self.LOG_SYNC_BYTES:
+                    _fdatasync(self._log_handle.fileno())
+                    self._log_unsynced_bytes = 0
+            except IOError as e:
+                logger.error(f"Failed to append to cache log: {e}")
+    
+    def _save_cache(self) -> None:
+        
+        snapshot = self.cache
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(snapshot))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cache_file)
+            logger.debug(f"Saved {len(snapshot)} entries to cache file")
+        except OSError as e:
             logger.error(f"Failed to save cache file: {e}")
+            return
+        
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self._log_entries = 0
+        self._log_unsynced_bytes = 0
+    
+    def _maybe_flush(self) -> None:
+        
+        with self._io_lock:
+            self._dirty = True
+            needs_compaction = self._log_entries >= max(self.COMPACT_MIN_ENTRIES, self._entry_count())
+        if needs_compaction:
+            self.flush()
     
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def _flush_locked(self) -> None:
         
+        if self._dirty:
+            self._save_cache()
+            self._dirty = False
+    
+    def flush(self) -> None:
+        
+        self._acquire_all()
         try:
-            timestamp_str = entry.get('timestamp')
-            if not timestamp_str:
-                return True
-            
-            timestamp = datetime.fromisoformat(timestamp_str)
-            expiry = timestamp + timedelta(hours=self.ttl_hours)
-            return datetime.now() > expiry
-        except (ValueError, TypeError):
-            return True
+            with self._io_lock:
+                self._flush_locked()
+        finally:
+            self._release_all()
+    
+    @staticmethod
+    def _flush_at_exit(ref: "weakref.ref") -> None:
+        
+        manager = ref()
+        if manager is not None:
+            manager.flush()
+    
+    def _is_expired(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        
+        if now is None:
+            now = time.time()
+        return entry.get('expires_at', 0.0) < now
     
     def _cleanup_expired(self) -> None:
         
-        with self._lock:
-            original_count = len(self.cache)
-            self.cache = {
-                key: value
-                for key, value in self.cache.items()
-                if not self._is_expired(value)
-            }
-            removed = original_count - len(self.cache)
-            if removed > 0:
-                logger.info(f"Cleaned up {removed} expired cache entries")
-                self._save_cache()
+        now = time.time()
+        removed = 0
+        for index, lock in enumerate(self._locks):
+            with lock:
+                shard = self._shards[index]
+                expired = [key for key, value in shard.items() if value.get('expires_at', 0.0) < now]
+                for key in expired:
+                    del shard[key]
+                removed += len(expired)
+        
+        if removed > 0:
+            logger.info(f"Cleaned up {removed} expired cache entries")
+            self._maybe_flush()
+    
+    def _schedule_cleanup(self) -> None:
+        
+        interval = max(self.ttl_hours * 900, self.MIN_CLEANUP_INTERVAL)
+        timer = Timer(interval, CacheManager._periodic_cleanup, args=(weakref.ref(self),))
+        timer.daemon = True
+        timer.start()
+        self._cleanup_timer = timer
+    
+    @staticmethod
+    def _periodic_cleanup(ref: "weakref.ref") -> None:
+        
+        manager = ref()
+        if manager is None or manager._cleanup_timer is None:
+            return
+        manager._cleanup_expired()
+        manager._schedule_cleanup()
+    
+    def close(self) -> None:
+        
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.cancel()
+            self._cleanup_timer = None
+        self.flush()
+        with self._io_lock:
+            if self._log_handle is not None:
+                if self._log_unsynced_bytes:
+                    _fdatasync(self._log_handle.fileno())
+                    self._log_unsynced_bytes = 0
+                self._log_handle.close()
+                self._log_handle = None
     
     def get(self, text: str) -> Optional[Dict[str, Any]]:
         
         key = self._generate_key(text)
+        index = self._shard_index(key)
         
-        if hash(key) % 100 == 0:
-            self._cleanup_expired()
+        entry = self._shards[index].get(key)
+        if entry is not None and not self._is_expired(entry):
+            self._thread_hit_counter()[0] += 1
+            result = entry.get('result')
+            return {**result, 'cached': True} if result else result
         
-        with self._lock:
-            entry = self.cache.get(key)
+        with self._locks[index]:
+            shard = self._shards[index]
+            entry = shard.get(key)
             
             if entry is None:
-                self.misses += 1
+                self._misses[index] += 1
                 return None
             
             if self._is_expired(entry):
-                self.misses += 1
-                del self.cache[key]
-                self._save_cache()
-                return None
-            
-            self.hits += 1
-            result = entry.get('result')
-            if result:
-                result['cached'] = True
-            return result
+                self._misses[index] += 1
+                del shard[key]
+                expired = True
+            else:
+                self._hits[index] += 1
+                expired = False
+                result = entry.get('result')
+                if result:
+                    result = {**result, 'cached': True}
+        
+        if expired:
+            self._maybe_flush()
+            return None
+        return result
     
     def set(self, text: str, result: Dict[str, Any]) -> None:
         
         key = self._generate_key(text)
+        index = self._shard_index(key)
         
-        with self._lock:
-            self.cache[key] = {
-                'timestamp': datetime.now().isoformat(),
-                'text_preview': text[:100] + '...' if len(text) > 100 else text,
-                'result': result
-            }
-            
-            self._save_cache()
-            
-            logger.debug(f"Cached result with key {key}")
+        now = time.time()
+        entry = {
+            'timestamp': iso_timestamp(now),
+            'expires_at': now + self.ttl_hours * 3600,
+            'text_preview': text[:100] + '...' if len(text) > 100 else text,
+            'result': dict(result)
+        }
+        
+        with self._locks[index]:
+            self._shards[index][key] = entry
+            self._append_log(key, entry)
+        
+        self._maybe_flush()
+        logger.debug("Cached result with key %s", key)
     
     def clear(self) -> None:
         
-        with self._lock:
+        self._acquire_all()
+        try:
             self.cache = {}
-            self.hits = 0
-            self.misses = 0
-            self._save_cache()
-            logger.info("Cache cleared")
+            self._hits = [0] * self.SHARD_COUNT
+            self._misses = [0] * self.SHARD_COUNT
+            with self._io_lock:
+                self._retired_hits = 0
+                for _, counter in self._thread_hits:
+                    counter[0] = 0
+                self._dirty = True
+                self._flush_locked()
+        finally:
+            self._release_all()
+        logger.info("Cache cleared")
     
     def stats(self) -> Dict[str, Any]:
         
-        total_requests = self.hits + self.misses
-        hit_rate = self.hits / total_requests if total_requests > 0 else 0.0
+        hits = self.hits
+        misses = self.misses
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0.0
         
-        try:
-            size_bytes = os.path.getsize(self.cache_file) if os.path.exists(self.cache_file) else 0
-        except OSError:
-            size_bytes = 0
+        size_bytes = 0
+        for path in (self.cache_file, self.log_file):
+            try:
+                size_bytes += os.path.getsize(path)
+            except OSError:
+                pass
         
         return {
-            "total_entries": len(self.cache),
-            "hits": self.hits,
-            "misses": self.misses,
+            "total_entries": self._entry_count(),
+            "hits": hits,
+            "misses": misses,
             "hit_rate": round(hit_rate, 4),
             "size_bytes": size_bytes,
             "ttl_hours": self.ttl_hours
@@ -157,15 +438,19 @@ class CacheManager:
     
     def get_recent_entries(self, limit: int = 10) -> list:
         
-        entries = []
-        for key, value in self.cache.items():
-            entries.append({
+        snapshot = [list(shard.items()) for shard in self._shards]
+        recent = heapq.nlargest(
+            limit,
+            chain.from_iterable(snapshot),
+            key=lambda item: item[1].get("timestamp", "")
+        )
+        
+        return [
+            {
                 "key": key,
                 "timestamp": value.get("timestamp"),
                 "preview": value.get("text_preview", ""),
                 "prediction": value.get("result", {}).get("prediction", "N/A")
-            })
-        
-        entries.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        
-        return entries[:limit]
+            }
+            for key, value in recent
+        ]
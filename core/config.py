@@ -7,6 +7,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+API_KEY_PLACEHOLDERS = {
+    "hf_api_key": "hf_your_huggingface_api_key_here",
+    "gemini_api_key": "your_gemini_api_key_here",
+    "groq_api_key": "your_groq_api_key_here"
+}
+
+TRUTHY_VALUES = {"1", "true", "yes", "on"}
+
 @dataclass
 class Config:
     
@@ -35,6 +43,7 @@ class Config:
     cache_ttl_hours: int = 24
     request_timeout: int = 30
     model_timeout: int = 10
+    llm_batching: bool = False
     
     hf_model_id: str = "hamzab/roberta-fake-news-classification"
     
@@ -78,6 +87,7 @@ class Config:
             config.cache_ttl_hours = int(secrets.get("CACHE_TTL_HOURS", 24))
             config.request_timeout = int(secrets.get("REQUEST_TIMEOUT", 30))
             config.model_timeout = int(secrets.get("MODEL_TIMEOUT", 10))
+            config.llm_batching = str(secrets.get("LLM_BATCHING", False)).strip().lower() in TRUTHY_VALUES
             
             logger.info("Configuration loaded successfully from secrets")
             
@@ -86,17 +96,22 @@ class Config:
         
         return config
     
+    def _has_key(self, name: str) -> bool:
+        
+        value = getattr(self, name)
+        return bool(value and value != API_KEY_PLACEHOLDERS[name])
+    
     def has_hf_key(self) -> bool:
         
-        return bool(self.hf_api_key and self.hf_api_key != "hf_your_huggingface_api_key_here")
+        return self._has_key("hf_api_key")
     
     def has_gemini_key(self) -> bool:
         
-        return bool(self.gemini_api_key and self.gemini_api_key != "your_gemini_api_key_here")
+        return self._has_key("gemini_api_key")
     
     def has_groq_key(self) -> bool:
         
-        return bool(self.groq_api_key and self.groq_api_key != "your_groq_api_key_here")
+        return self._has_key("groq_api_key")
     
     def get_active_models(self) -> list:
         
@@ -108,7 +123,7 @@ class Config:
             models.append("gemini")
         if self.has_groq_key():
             models.append("groq")
-            
+        
         return models
     
     def to_dict(self) -> Dict[str, Any]:
@@ -129,5 +144,6 @@ class Config:
             "cache_ttl_hours": self.cache_ttl_hours,
             "request_timeout": self.request_timeout,
             "model_timeout": self.model_timeout,
+            "llm_batching": self.llm_batching,
             "active_models": self.get_active_models()
         }
@@ -3,48 +3,41 @@
 import asyncio
 import logging
 import time
-from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+
+import numpy as np
 
 from .config import Config
 from .heuristic import HeuristicAnalyzer
 from .hf_client import HuggingFaceClient, QuotaExceededError as HFQuotaError
 from .gemini_client import GeminiClient, QuotaExceededError as GeminiQuotaError
 from .groq_client import GroqClient, QuotaExceededError as GroqQuotaError
+from .http_session import close_session
+from .timestamps import iso_timestamp
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class PredictionResult:
-    
-    prediction: str
-    fake_probability: float
-    confidence: float
-    processing_time: float
-    models_used: List[str]
-    model_scores: List[Dict[str, Any]]
-    indicators: Dict[str, float]
-    indicator_details: List[Dict[str, Any]]
-    explanation: str
-    timestamp: str
-    cached: bool = False
-    
-    def to_dict(self) -> Dict[str, Any]:
-        
-        return {
-            "prediction": self.prediction,
-            "fake_probability": self.fake_probability,
-            "confidence": self.confidence,
-            "processing_time": self.processing_time,
-            "models_used": self.models_used,
-            "model_scores": self.model_scores,
-            "indicators": self.indicators,
-            "indicator_details": self.indicator_details,
-            "explanation": self.explanation,
-            "timestamp": self.timestamp,
-            "cached": self.cached
-        }
+WEIGHT_MAPPING = {
+    "heuristic": "heuristic",
+    "huggingface": "huggingface",
+    "gemini": "llm",
+    "groq": "llm"
+}
+
+VERDICT_EXPLANATIONS = {
+    "FAKE": "This article shows strong indicators of misinformation (fake probability: {:.0f}%).",
+    "REAL": "This article appears to be authentic (fake probability: {:.0f}%).",
+    "UNCERTAIN": "The analysis is inconclusive (fake probability: {:.0f}%)."
+}
+
+MODEL_AGREEMENT_NOTE = "All models are in agreement."
+MODEL_SPREAD_TEMPLATE = "Model predictions vary from {:.0f}% to {:.0f}%."
+LOW_CONFIDENCE_NOTE = "Note: Confidence is moderate. Consider additional verification."
+
+INDICATOR_LABELS = {
+    name: name.replace("_", " ")
+    for name in ("emotional_language", "clickbait_patterns", "excessive_punctuation", "caps_ratio")
+}
 
 class EnsemblePredictor:
     
@@ -80,14 +73,34 @@ class EnsemblePredictor:
     
     async def predict(self, text: str) -> Dict[str, Any]:
         
-        start_time = time.time()
+        return await self._predict(text, time.perf_counter_ns())
+    
+    async def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        
+        if not self.config.llm_batching or len(texts) < 2:
+            return list(await asyncio.gather(*(self.predict(text) for text in texts)))
         
-        model_results = await self._run_models_parallel(text)
+        start_ns = time.perf_counter_ns()
+        llm_results = await self._run_llm_batch_with_fallback(texts)
+        
+        return list(await asyncio.gather(*(
+            self._predict(text, start_ns, self._resolved(llm_result))
+            for text, llm_result in zip(texts, llm_results)
+        )))
+    
+    async def _predict(
+        self,
+        text: str,
+        start_ns: int,
+        llm_task=None
+    ) -> Dict[str, Any]:
+        
+        model_results = await self._run_models_parallel(text, llm_task)
         
         result = self._aggregate_results(model_results)
         
-        result["processing_time"] = round(time.time() - start_time, 4)
-        result["timestamp"] = datetime.now().isoformat()
+        result["processing_time"] = round((time.perf_counter_ns() - start_ns) / 1e9, 4)
+        result["timestamp"] = iso_timestamp()
         
         logger.info(
             f"Ensemble prediction: {result['prediction']} "
@@ -98,30 +111,35 @@ class EnsemblePredictor:
         
         return result
     
-    async def _run_models_parallel(self, text: str) -> List[Dict[str, Any]]:
+    async def close(self) -> None:
         
-        results = []
+        self.hf_client.close()
+        await close_session()
+    
+    async def _run_models_parallel(self, text: str, llm_task=None) -> List[Dict[str, Any]]:
         
-        try:
-            heuristic_result = self.heuristic.analyze(text)
-            results.append(heuristic_result)
-        except Exception as e:
-            logger.error(f"Heuristic analysis failed: {e}")
+        tasks = {"heuristic": asyncio.to_thread(self.heuristic.analyze, text)}
         
         if self.config.has_hf_key() and self.hf_client.is_available():
-            try:
-                hf_result = await self._run_with_timeout(
-                    self.hf_client.predict(text),
-                    self.config.model_timeout,
-                    "huggingface"
-                )
-                results.append(hf_result)
-            except Exception as e:
-                logger.warning(f"HuggingFace failed: {e}")
+            tasks["huggingface"] = self._run_with_timeout(
+                self.hf_client.predict(text),
+                self.config.model_timeout,
+                "huggingface"
+            )
+        
+        tasks["llm"] = llm_task if llm_task is not None else self._run_llm_with_fallback(text)
         
-        llm_result = await self._run_llm_with_fallback(text)
-        if llm_result:
-            results.append(llm_result)
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        results = []
+        for name, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, BaseException):
+                if name == "heuristic":
+                    logger.error(f"Heuristic analysis failed: {outcome}")
+                else:
+                    logger.warning(f"{name} failed: {outcome}")
+            elif outcome:
+                results.append(outcome)
         
         return results
     
@@ -158,6 +176,34 @@ class EnsemblePredictor:
         logger.warning("Both Gemini and Groq unavailable, using heuristic only")
         return None
     
+    async def _run_llm_batch_with_fallback(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        
+        clients = (
+            ("gemini", self.config.has_gemini_key(), self.gemini_client),
+            ("groq", self.config.has_groq_key(), self.groq_client)
+        )
+        for name, has_key, client in clients:
+            if not (has_key and client.is_available()):
+                continue
+            try:
+                results = await self._run_with_timeout(
+                    client.predict_batch(texts),
+                    self.config.model_timeout,
+                    name
+                )
+                logger.info(f"{name} batch prediction successful ({len(texts)} texts)")
+                return results
+            except Exception as e:
+                logger.warning(f"{name} batch prediction failed: {e}")
+        
+        logger.warning("No LLM available for batch, using heuristic only")
+        return [None] * len(texts)
+    
+    @staticmethod
+    async def _resolved(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        
+        return result
+    
     async def _run_with_timeout(
         self,
         coro,
@@ -179,54 +225,19 @@ class EnsemblePredictor:
         if not model_results:
             return self._create_fallback_result()
         
-        weighted_prob = 0.0
-        weighted_conf = 0.0
-        total_weight = 0.0
+        if len(model_results) == 1:
+            fake_probability, confidence, model_scores = self._single_model_scores(model_results[0])
+        else:
+            fake_probability, confidence, model_scores = self._weighted_model_scores(model_results)
         
-        models_used = []
-        model_scores = []
+        models_used = [m["model_name"] for m in model_scores]
         indicators = {}
         indicator_details = []
-        
-        weight_mapping = {
-            "heuristic": "heuristic",
-            "huggingface": "huggingface",
-            "gemini": "llm",
-            "groq": "llm"
-        }
-        
         for result in model_results:
-            model_name = result.get("model_name", "unknown")
-            models_used.append(model_name)
-            
-            weight_key = weight_mapping.get(model_name, model_name)
-            weight = self.config.ensemble_weights.get(weight_key, 0.1)
-            
-            prob = result.get("fake_probability", 0.5)
-            conf = result.get("confidence", 0.5)
-            
-            weighted_prob += prob * weight
-            weighted_conf += conf * weight
-            total_weight += weight
-            
-            model_scores.append({
-                "model_name": model_name,
-                "fake_probability": prob,
-                "confidence": conf,
-                "processing_time": result.get("processing_time", 0),
-                "weight": weight
-            })
-            
-            if model_name == "heuristic":
+            if result.get("model_name") == "heuristic":
                 indicators = result.get("indicators", {})
                 indicator_details = result.get("indicator_details", [])
-        
-        if total_weight > 0:
-            fake_probability = weighted_prob / total_weight
-            confidence = weighted_conf / total_weight
-        else:
-            fake_probability = 0.5
-            confidence = 0.5
+                break
         
         prediction = self._determine_verdict(fake_probability, confidence)
         
@@ -248,6 +259,57 @@ class EnsemblePredictor:
             "cached": False
         }
     
+    def _single_model_scores(
+        self,
+        result: Dict[str, Any]
+    ) -> Tuple[float, float, List[Dict[str, Any]]]:
+        
+        fake_probability = result.get("fake_probability", 0.5)
+        confidence = result.get("confidence", 0.5)
+        model_scores = [{
+            "model_name": result.get("model_name", "unknown"),
+            "fake_probability": fake_probability,
+            "confidence": confidence,
+            "processing_time": result.get("processing_time", 0),
+            "weight": 1.0
+        }]
+        return fake_probability, confidence, model_scores
+    
+    def _weighted_model_scores(
+        self,
+        model_results: List[Dict[str, Any]]
+    ) -> Tuple[float, float, List[Dict[str, Any]]]:
+        
+        ensemble_weights = self.config.ensemble_weights
+        model_scores = []
+        
+        for result in model_results:
+            model_name = result.get("model_name", "unknown")
+            weight_key = WEIGHT_MAPPING.get(model_name, model_name)
+            
+            model_scores.append({
+                "model_name": model_name,
+                "fake_probability": result.get("fake_probability", 0.5),
+                "confidence": result.get("confidence", 0.5),
+                "processing_time": result.get("processing_time", 0),
+                "weight": ensemble_weights.get(weight_key, 0.1)
+            })
+        
+        count = len(model_scores)
+        probs = np.fromiter((m["fake_probability"] for m in model_scores), dtype=np.float64, count=count)
+        confs = np.fromiter((m["confidence"] for m in model_scores), dtype=np.float64, count=count)
+        weights = np.fromiter((m["weight"] for m in model_scores), dtype=np.float64, count=count)
+        
+        total_weight = weights.sum()
+        if total_weight > 0:
+            fake_probability = float(np.dot(probs, weights) / total_weight)
+            confidence = float(np.dot(confs, weights) / total_weight)
+        else:
+            fake_probability = 0.5
+            confidence = 0.5
+        
+        return fake_probability, confidence, model_scores
+    
     def _determine_verdict(
         self,
         fake_probability: float,
@@ -273,42 +335,27 @@ class EnsemblePredictor:
         indicators: Dict[str, float]
     ) -> str:
         
-        parts = []
-        
-        if prediction == "FAKE":
-            parts.append(
-                f"This article shows strong indicators of misinformation "
-                f"(fake probability: {fake_probability*100:.0f}%)."
-            )
-        elif prediction == "REAL":
-            parts.append(
-                f"This article appears to be authentic "
-                f"(fake probability: {fake_probability*100:.0f}%)."
-            )
-        else:
-            parts.append(
-                f"The analysis is inconclusive "
-                f"(fake probability: {fake_probability*100:.0f}%)."
-            )
+        template = VERDICT_EXPLANATIONS.get(prediction, VERDICT_EXPLANATIONS["UNCERTAIN"])
+        parts = [template.format(fake_probability * 100)]
         
         if len(model_scores) > 1:
             scores = [m["fake_probability"] for m in model_scores]
             min_score, max_score = min(scores), max(scores)
             if max_score - min_score < 0.2:
-                parts.append("All models are in agreement.")
+                parts.append(MODEL_AGREEMENT_NOTE)
             else:
-                parts.append(f"Model predictions vary from {min_score*100:.0f}% to {max_score*100:.0f}%.")
+                parts.append(MODEL_SPREAD_TEMPLATE.format(min_score * 100, max_score * 100))
         
         high_indicators = [
-            name for name, score in indicators.items()
+            INDICATOR_LABELS.get(name) or name.replace("_", " ")
+            for name, score in indicators.items()
             if score >= 0.5
         ]
         if high_indicators:
-            formatted = ", ".join(name.replace("_", " ") for name in high_indicators)
-            parts.append(f"Key concerns: {formatted}.")
+            parts.append(f"Key concerns: {', '.join(high_indicators)}.")
         
         if confidence < 0.7:
-            parts.append("Note: Confidence is moderate. Consider additional verification.")
+            parts.append(LOW_CONFIDENCE_NOTE)
         
         return " ".join(parts)
     
@@ -324,7 +371,7 @@ class EnsemblePredictor:
             "indicator_details": [],
             "explanation": "Unable to analyze: all models failed. Please try again.",
             "processing_time": 0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_timestamp(),
             "cached": False
         }
     
@@ -3,12 +3,14 @@
 import aiohttp
 import asyncio
 import time
-import json
-import re
 import logging
 from datetime import datetime, date
-from typing import Dict, Any, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from typing import Dict, Any, List, Optional
+
+from .http_session import get_session, encode_json, decode_json, extract_json_object, parse_result_list
+from .http_session import MAX_ATTEMPTS, backoff_delay, retry_after_delay
+from .rate_limiter import ClientTokenBucket
+from .timestamps import next_local_midnight
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,10 @@ class QuotaExceededError(Exception):
 class GeminiClient:
     
     API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+    RATE_LIMIT_PER_SECOND = 0.25
+    RATE_LIMIT_BURST = 5
+    MAX_OUTPUT_TOKENS = 500
+    MAX_BATCH_SIZE = 16
     
     SYSTEM_PROMPT = (
         "You are an expert fact-checker. Analyze the given news text for misinformation. "
@@ -26,12 +32,19 @@ class GeminiClient:
         '{"fake_probability": 0.75, "confidence": 0.85, "reasoning": "Brief explanation", "red_flags": ["flag1"]}. '
         "fake_probability and confidence must be between 0.0 and 1.0."
     )
+    
+    BATCH_PROMPT = (
+        "Analyze each text in the following JSON array independently. "
+        'Respond with ONLY a valid JSON object of the form {"results": [...]} '
+        "holding one result object per text, in the same order:\n\n"
+    )
 
     def __init__(
         self,
         api_key: str,
         daily_quota: int = 1500,
-        timeout: int = 10
+        timeout: int = 10,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         
         self.api_key = api_key
@@ -39,20 +52,46 @@ class GeminiClient:
         self.timeout = timeout
         self.usage_today = 0
         self.last_reset_date = date.today()
+        self._next_reset_ts = next_local_midnight()
         self.last_success_time: Optional[datetime] = None
         self.success_count = 0
         self.error_count = 0
-        self._total_latency = 0.0
+        self._total_latency_ns = 0
+        self._session = session
+        self._url = f"{self.API_URL}?key={api_key}"
+        self._headers = {"Content-Type": "application/json"}
+        self._bucket = ClientTokenBucket(self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST)
+        self._payload_template = self._build_payload_template(self.MAX_OUTPUT_TOKENS)
+        self._batch_payload_template = self._build_payload_template(self.MAX_OUTPUT_TOKENS * self.MAX_BATCH_SIZE)
         
         logger.info(f"GeminiClient initialized with quota {daily_quota}")
     
+    def _build_payload_template(self, max_tokens: int) -> Dict[str, Any]:
+        
+        return {
+            "contents": [{
+                "parts": [{
+                    "text": None
+                }]
+            }],
+            "generationConfig": {
+                "temperature": 0.1,
+                "maxOutputTokens": max_tokens,
+                "responseMimeType": "application/json"
+            }
+        }
+    
     def _check_quota_reset(self) -> None:
         
+        if time.time() < self._next_reset_ts:
+            return
+        
         today = date.today()
         if today > self.last_reset_date:
             logger.info(f"Resetting Gemini quota (new day: {today})")
             self.usage_today = 0
             self.last_reset_date = today
+        self._next_reset_ts = next_local_midnight()
     
     def _check_quota(self) -> None:
         
@@ -87,55 +126,71 @@ class GeminiClient:
             "status": "healthy" if self.is_available() else "unavailable",
             "last_success": self.last_success_time.isoformat() if self.last_success_time else None,
             "success_rate": (self.success_count / total_requests * 100) if total_requests > 0 else 100,
-            "avg_latency": (self._total_latency / self.success_count) if self.success_count > 0 else 0,
+            "avg_latency": (self._total_latency_ns / 1e9 / self.success_count) if self.success_count > 0 else 0,
             "quota": self.get_quota_usage()
         }
     
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-        reraise=True
-    )
     async def _make_request(self, text: str) -> Dict[str, Any]:
         
-        url = f"{self.API_URL}?key={self.api_key}"
-        
-        headers = {"Content-Type": "application/json"}
-        
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": f"{self.SYSTEM_PROMPT}\n\nAnalyze this text:\n\n{text[:3000]}"
-                }]
-            }],
-            "generationConfig": {
-                "temperature": 0.1,
-                "maxOutputTokens": 500,
-                "responseMimeType": "application/json"
-            }
-        }
+        payload = self._payload_template
+        payload["contents"][0]["parts"][0]["text"] = f"{self.SYSTEM_PROMPT}\n\nAnalyze this text:\n\n{text[:3000]}"
+        return await self._send(encode_json(payload))
+    
+    async def _make_batch_request(self, texts: List[str]) -> Dict[str, Any]:
         
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        payload = self._batch_payload_template
+        payload["contents"][0]["parts"][0]["text"] = (
+            f"{self.SYSTEM_PROMPT}\n\n{self.BATCH_PROMPT}"
+            + encode_json([text[:3000] for text in texts]).decode('utf-8')
+        )
+        return await self._send(encode_json(payload))
+    
+    async def _send(self, body: bytes) -> Dict[str, Any]:
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 429:
-                    raise QuotaExceededError("Rate limit exceeded")
-                elif response.status == 400:
-                    error_text = await response.text()
-                    if "quota" in error_text.lower():
-                        raise QuotaExceededError("API quota exceeded")
-                    raise aiohttp.ClientError(f"Bad request: {error_text}")
-                elif response.status != 200:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if not await self._bucket.acquire(max_wait=deadline - loop.time()):
+                raise QuotaExceededError("Client rate limit leaves no time for the request")
+            session = self._session or get_session()
+            try:
+                async with session.post(
+                    self._url,
+                    data=body,
+                    headers=self._headers,
+                    timeout=aiohttp.ClientTimeout(total=deadline - loop.time())
+                ) as response:
+                    if response.status == 200:
+                        self._bucket.increase()
+                        return decode_json(await response.read())
+                    status = response.status
+                    retry_after = retry_after_delay(response.headers)
                     error_text = await response.text()
-                    raise aiohttp.ClientError(f"API error {response.status}: {error_text}")
-                
-                return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                delay = backoff_delay(attempt)
+                if attempt == MAX_ATTEMPTS or loop.time() + delay >= deadline:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            
+            if status == 429:
+                self._bucket.decrease(drain=retry_after is None)
+                if retry_after is None or attempt == MAX_ATTEMPTS or loop.time() + retry_after >= deadline:
+                    raise QuotaExceededError("Rate limit exceeded")
+                await asyncio.sleep(retry_after)
+            elif status == 400:
+                if "quota" in error_text.lower():
+                    raise QuotaExceededError("API quota exceeded")
+                raise aiohttp.ClientError(f"Bad request: {error_text}")
+            else:
+                delay = backoff_delay(attempt)
+                if status < 500 or attempt == MAX_ATTEMPTS or loop.time() + delay >= deadline:
+                    raise aiohttp.ClientError(f"API error {status}: {error_text}")
+                await asyncio.sleep(delay)
     
     async def predict(self, text: str) -> Dict[str, Any]:
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             self._check_quota()
@@ -143,11 +198,12 @@ class GeminiClient:
             self.usage_today += 1
             
             result = self._parse_response(response)
-            processing_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = elapsed_ns / 1e9
             
             self.success_count += 1
             self.last_success_time = datetime.now()
-            self._total_latency += processing_time
+            self._total_latency_ns += elapsed_ns
             
             return {
                 "model_name": "gemini",
@@ -167,44 +223,104 @@ class GeminiClient:
             logger.error(f"Gemini prediction failed: {e}")
             raise
     
-    def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+    async def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        
+        chunks = [texts[i:i + self.MAX_BATCH_SIZE] for i in range(0, len(texts), self.MAX_BATCH_SIZE)]
+        batches = await asyncio.gather(*(self._predict_chunk(chunk) for chunk in chunks))
+        return [result for batch in batches for result in batch]
+    
+    async def _predict_chunk(self, texts: List[str]) -> List[Dict[str, Any]]:
+        
+        start_ns = time.perf_counter_ns()
         
         try:
-            candidates = response.get("candidates", [])
-            if not candidates:
-                return self._default_result()
+            self._check_quota()
+            response = await self._make_batch_request(texts)
+            self.usage_today += 1
             
-            content = candidates[0].get("content", {})
-            parts = content.get("parts", [])
-            if not parts:
-                return self._default_result()
+            results = self._parse_batch_response(response, len(texts))
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = round(elapsed_ns / 1e9, 4)
             
-            text = parts[0].get("text", "")
-            if not text:
-                return self._default_result()
+            self.success_count += 1
+            self.last_success_time = datetime.now()
+            self._total_latency_ns += elapsed_ns
             
-            try:
-                result = json.loads(text)
-            except json.JSONDecodeError:
-                json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    return self._default_result()
+            return [
+                {
+                    "model_name": "gemini",
+                    "fake_probability": result["fake_probability"],
+                    "confidence": result["confidence"],
+                    "processing_time": processing_time,
+                    "reasoning": result.get("reasoning", ""),
+                    "red_flags": result.get("red_flags", []),
+                    "raw_response": response
+                }
+                for result in results
+            ]
             
+        except QuotaExceededError:
+            self.error_count += 1
+            raise
+        except Exception as e:
+            self.error_count += 1
+            logger.error(f"Gemini batch prediction failed: {e}")
+            raise
+    
+    def _response_text(self, response: Dict[str, Any]) -> Optional[str]:
+        
+        candidates = response.get("candidates")
+        if not candidates:
+            return None
+        
+        try:
+            text = candidates[0]["content"]["parts"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            return None
+        
+        if not text or not isinstance(text, str):
+            return None
+        return text
+    
+    def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        
+        text = self._response_text(response)
+        if text is None:
+            return self._default_result()
+        
+        result = extract_json_object(text)
+        if result is None:
+            return self._default_result()
+        
+        return self._coerce_result(result)
+    
+    def _parse_batch_response(self, response: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        
+        text = self._response_text(response)
+        items = parse_result_list(text) if text is not None else []
+        
+        results = [
+            self._coerce_result(item) if isinstance(item, dict) else self._default_result()
+            for item in items[:count]
+        ]
+        results.extend(self._default_result() for _ in range(count - len(results)))
+        return results
+    
+    def _coerce_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        
+        try:
             fake_probability = float(result.get("fake_probability", 0.5))
             confidence = float(result.get("confidence", 0.5))
-            
-            return {
-                "fake_probability": round(max(0.0, min(1.0, fake_probability)), 4),
-                "confidence": round(max(0.0, min(1.0, confidence)), 4),
-                "reasoning": result.get("reasoning", ""),
-                "red_flags": result.get("red_flags", [])
-            }
-            
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to parse Gemini response: {e}")
             return self._default_result()
+        
+        return {
+            "fake_probability": round(max(0.0, min(1.0, fake_probability)), 4),
+            "confidence": round(max(0.0, min(1.0, confidence)), 4),
+            "reasoning": result.get("reasoning", ""),
+            "red_flags": result.get("red_flags", [])
+        }
     
     def _default_result(self) -> Dict[str, Any]:
         
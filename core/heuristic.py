@@ -1,13 +1,62 @@
 
 
+import hashlib
+import operator
 import re
 import time
-from typing import Dict, Any, List, Set
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, List, Tuple
 from dataclasses import dataclass
+from threading import Lock
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+EMOTIONAL_WORDS: FrozenSet[str] = frozenset({
+    "shocking", "unbelievable", "incredible", "astonishing", "mindblowing",
+    "jaw-dropping", "bombshell", "explosive", "stunning", "outrageous",
+    "terrifying", "horrifying", "alarming", "devastating", "catastrophic",
+    "dangerous", "deadly", "crisis", "emergency", "urgent",
+    "disgraceful", "scandalous", "corrupt", "evil", "sinister",
+    "betrayal", "conspiracy", "coverup", "exposed", "revealed",
+    "amazing", "revolutionary", "breakthrough", "miracle", "secret",
+    "banned", "censored", "forbidden", "hidden", "suppressed",
+    "never", "always", "everyone", "nobody", "completely", "totally",
+    "absolutely", "definitely", "proven", "confirmed"
+})
+
+EMOTIONAL_PHRASE_REGEX = re.compile(
+    r"\b(?:" + "|".join(re.escape(word) for word in sorted(EMOTIONAL_WORDS) if not word.isalpha()) + r")\b"
+)
+
+CLICKBAIT_PATTERNS: Tuple[str, ...] = (
+    r"you\s+won'?t\s+believe",
+    r"what\s+happens?\s+next",
+    r"doctors?\s+hate\s+(?:him|her|this|them)",
+    r"this\s+one\s+(?:simple|weird|strange)\s+trick",
+    r"the\s+truth\s+about",
+    r"exposed:?\s+",
+    r"breaking:?\s+",
+    r"must\s+(?:see|read|watch)",
+    r"click\s+here\s+to",
+    r"share\s+before\s+(?:it'?s?\s+)?deleted",
+    r"they\s+don'?t\s+want\s+you\s+to\s+know",
+    r"is\s+this\s+the\s+end\s+of",
+    r"finally\s+revealed",
+    r"\d+\s+reasons?\s+why",
+    r"number\s+\d+\s+will\s+(?:shock|surprise|amaze)"
+)
+
+CLICKBAIT_REGEX = re.compile("|".join(f"(?:{pattern})" for pattern in CLICKBAIT_PATTERNS))
+
+CAPS_WORD_REGEX = re.compile(r'\b[A-Z]{3,}\b')
+
+WORD_REGEX = re.compile(r'\b[a-z]+\b')
+
+INDICATOR_WEIGHTS: Tuple[float, ...] = (0.25, 0.35, 0.20, 0.20)
+
 @dataclass
 class IndicatorResult:
     
@@ -20,62 +69,46 @@ class IndicatorResult:
 class HeuristicAnalyzer:
     
     
-    EMOTIONAL_WORDS: Set[str] = {
-        "shocking", "unbelievable", "incredible", "astonishing", "mindblowing",
-        "jaw-dropping", "bombshell", "explosive", "stunning", "outrageous",
-        "terrifying", "horrifying", "alarming", "devastating", "catastrophic",
-        "dangerous", "deadly", "crisis", "emergency", "urgent",
-        "disgraceful", "scandalous", "corrupt", "evil", "sinister",
-        "betrayal", "conspiracy", "coverup", "exposed", "revealed",
-        "amazing", "revolutionary", "breakthrough", "miracle", "secret",
-        "banned", "censored", "forbidden", "hidden", "suppressed",
-        "never", "always", "everyone", "nobody", "completely", "totally",
-        "absolutely", "definitely", "proven", "confirmed"
-    }
-    
-    CLICKBAIT_PATTERNS: List[str] = [
-        r"you\s+won'?t\s+believe",
-        r"what\s+happens?\s+next",
-        r"doctors?\s+hate\s+(him|her|this|them)",
-        r"this\s+one\s+(simple|weird|strange)\s+trick",
-        r"the\s+truth\s+about",
-        r"exposed:?\s+",
-        r"breaking:?\s+",
-        r"must\s+(see|read|watch)",
-        r"click\s+here\s+to",
-        r"share\s+before\s+(it'?s?\s+)?deleted",
-        r"they\s+don'?t\s+want\s+you\s+to\s+know",
-        r"is\s+this\s+the\s+end\s+of",
-        r"finally\s+revealed",
-        r"\d+\s+reasons?\s+why",
-        r"number\s+\d+\s+will\s+(shock|surprise|amaze)"
-    ]
-    
-    _compiled_patterns: List[re.Pattern] = None
+    MAX_HEURISTIC_CHARS = 8192
+    MIN_HEURISTIC_WORDS = 5
+    CAPS_SCAN_MIN_BYTES = 2048
+    RESULT_CACHE_SIZE = 512
     
     def __init__(self):
         
-        if HeuristicAnalyzer._compiled_patterns is None:
-            HeuristicAnalyzer._compiled_patterns = [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in self.CLICKBAIT_PATTERNS
-            ]
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = Lock()
         logger.info("HeuristicAnalyzer initialized")
     
     def analyze(self, text: str) -> Dict[str, Any]:
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         if not text or not text.strip():
-            return self._empty_result(time.time() - start_time)
+            return self._empty_result((time.perf_counter_ns() - start_ns) / 1e9)
+        
+        if len(text) > self.MAX_HEURISTIC_CHARS:
+            text = text[:self.MAX_HEURISTIC_CHARS]
+        
+        if len(text.split(maxsplit=self.MIN_HEURISTIC_WORDS)) < self.MIN_HEURISTIC_WORDS:
+            return self._short_text_result((time.perf_counter_ns() - start_ns) / 1e9)
+        
+        key = hashlib.blake2b(text.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        if cached is not None:
+            return {**cached, "processing_time": 0.0}
         
         text_lower = text.lower()
         text_stripped = text.strip()
+        text_bytes = np.frombuffer(text_stripped.encode('utf-8', errors='ignore'), dtype=np.uint8)
         
         emotional_result = self._analyze_emotional_language(text_lower)
         clickbait_result = self._analyze_clickbait_patterns(text_lower)
-        punctuation_result = self._analyze_excessive_punctuation(text_stripped)
-        caps_result = self._analyze_caps_ratio(text_stripped)
+        punctuation_result = self._analyze_excessive_punctuation(text_stripped, text_bytes)
+        caps_result = self._analyze_caps_ratio(text_stripped, text_bytes)
         
         indicators = {
             "emotional_language": emotional_result.score,
@@ -91,27 +124,18 @@ class HeuristicAnalyzer:
             caps_result
         ]
         
-        weights = {
-            "emotional_language": 0.25,
-            "clickbait_patterns": 0.35,
-            "excessive_punctuation": 0.20,
-            "caps_ratio": 0.20
-        }
-        
-        fake_probability = sum(
-            indicators[key] * weights[key]
-            for key in indicators
-        )
+        scores = [result.score for result in indicator_details]
+        fake_probability = sum(map(operator.mul, scores, INDICATOR_WEIGHTS))
         
         avg_extremity = sum(
             abs(score - 0.5) * 2
-            for score in indicators.values()
-        ) / len(indicators)
+            for score in scores
+        ) / len(scores)
         confidence = min(0.5 + avg_extremity * 0.5, 0.85)
         
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        return {
+        result = {
             "model_name": "heuristic",
             "fake_probability": round(fake_probability, 4),
             "confidence": round(confidence, 4),
@@ -128,11 +152,19 @@ class HeuristicAnalyzer:
                 for ind in indicator_details
             ]
         }
+        
+        with self._cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return dict(result)
     
     def _analyze_emotional_language(self, text_lower: str) -> IndicatorResult:
         
-        words = set(re.findall(r'\b[a-z]+\b', text_lower))
-        matches = words.intersection(self.EMOTIONAL_WORDS)
+        words = set(WORD_REGEX.findall(text_lower))
+        matches = words.intersection(EMOTIONAL_WORDS)
+        matches.update(EMOTIONAL_PHRASE_REGEX.findall(text_lower))
         
         word_count = len(words)
         if word_count == 0:
@@ -153,12 +185,7 @@ class HeuristicAnalyzer:
     
     def _analyze_clickbait_patterns(self, text_lower: str) -> IndicatorResult:
         
-        matches = []
-        
-        for pattern in self._compiled_patterns:
-            found = pattern.findall(text_lower)
-            if found:
-                matches.extend(found if isinstance(found[0], str) else [m[0] for m in found])
+        matches = CLICKBAIT_REGEX.findall(text_lower)
         
         if len(matches) == 0:
             score = 0.0
@@ -179,7 +206,7 @@ class HeuristicAnalyzer:
             matches=matches[:5]
         )
     
-    def _analyze_excessive_punctuation(self, text: str) -> IndicatorResult:
+    def _analyze_excessive_punctuation(self, text: str, text_bytes: np.ndarray) -> IndicatorResult:
         
         total_chars = len(text)
         if total_chars == 0:
@@ -191,12 +218,9 @@ class HeuristicAnalyzer:
                 matches=[]
             )
         
-        exclamations = text.count('!')
-        questions = text.count('?')
+        exclamations, questions, repeated = self._count_punctuation(text_bytes)
         emphatic_chars = exclamations + questions
         
-        repeated = len(re.findall(r'[!?]{2,}', text))
-        
         ratio = emphatic_chars / total_chars
         
         if ratio > 0.05:
@@ -218,10 +242,9 @@ class HeuristicAnalyzer:
             matches=[f"!×{exclamations}", f"?×{questions}"] if emphatic_chars > 0 else []
         )
     
-    def _analyze_caps_ratio(self, text: str) -> IndicatorResult:
+    def _analyze_caps_ratio(self, text: str, text_bytes: np.ndarray) -> IndicatorResult:
         
-        letters = [c for c in text if c.isalpha()]
-        total_letters = len(letters)
+        uppercase, total_letters = self._count_letters(text, text_bytes)
         
         if total_letters == 0:
             return IndicatorResult(
@@ -232,10 +255,9 @@ class HeuristicAnalyzer:
                 matches=[]
             )
         
-        uppercase = sum(1 for c in letters if c.isupper())
         ratio = uppercase / total_letters
         
-        caps_words = re.findall(r'\b[A-Z]{3,}\b', text)
+        caps_count, caps_words = self._find_caps_words(text, text_bytes)
         
         if ratio > 0.5:
             score = 1.0
@@ -250,9 +272,57 @@ class HeuristicAnalyzer:
             name="ALL CAPS Usage",
             score=round(score, 4),
             severity=severity,
-            description=f"{ratio:.1%} uppercase letters, {len(caps_words)} ALL CAPS words",
-            matches=caps_words[:5]
+            description=f"{ratio:.1%} uppercase letters, {caps_count} ALL CAPS words",
+            matches=caps_words
+        )
+    
+    def _count_punctuation(self, text_bytes: np.ndarray) -> Tuple[int, int, int]:
+        
+        is_exclamation = text_bytes == 0x21
+        is_question = text_bytes == 0x3F
+        emphatic = is_exclamation | is_question
+        
+        edges = np.diff(np.concatenate(([0], emphatic.view(np.int8), [0])))
+        run_lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        
+        return (
+            int(np.count_nonzero(is_exclamation)),
+            int(np.count_nonzero(is_question)),
+            int(np.count_nonzero(run_lengths >= 2))
+        )
+    
+    def _count_letters(self, text: str, text_bytes: np.ndarray) -> Tuple[int, int]:
+        
+        if text.isascii():
+            uppercase = int(np.count_nonzero((text_bytes >= 65) & (text_bytes <= 90)))
+            lowercase = int(np.count_nonzero((text_bytes >= 97) & (text_bytes <= 122)))
+            return uppercase, uppercase + lowercase
+        
+        letters = [c for c in text if c.isalpha()]
+        return sum(1 for c in letters if c.isupper()), len(letters)
+    
+    def _find_caps_words(self, text: str, text_bytes: np.ndarray) -> Tuple[int, List[str]]:
+        
+        if len(text_bytes) < self.CAPS_SCAN_MIN_BYTES or not text.isascii():
+            caps_words = CAPS_WORD_REGEX.findall(text)
+            return len(caps_words), caps_words[:5]
+        
+        upper = (text_bytes >= 65) & (text_bytes <= 90)
+        other_word = (
+            ((text_bytes >= 97) & (text_bytes <= 122))
+            | ((text_bytes >= 48) & (text_bytes <= 57))
+            | (text_bytes == 95)
         )
+        
+        edges = np.diff(np.concatenate(([0], (upper | other_word).view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        non_upper = np.concatenate(([0], np.cumsum(other_word)))
+        is_caps_word = (ends - starts >= 3) & (non_upper[ends] == non_upper[starts])
+        
+        starts = starts[is_caps_word]
+        ends = ends[is_caps_word]
+        return len(starts), [text[a:b] for a, b in zip(starts[:5].tolist(), ends[:5].tolist())]
     
     def _get_severity(self, score: float) -> str:
         
@@ -263,6 +333,13 @@ class HeuristicAnalyzer:
         else:
             return "LOW"
     
+    def _short_text_result(self, processing_time: float) -> Dict[str, Any]:
+        
+        result = self._empty_result(processing_time)
+        result["fake_probability"] = 0.5
+        result["confidence"] = 0.3
+        return result
+    
     def _empty_result(self, processing_time: float) -> Dict[str, Any]:
         
         return {
@@ -1,20 +1,27 @@
 
 
+import aiohttp
 import asyncio
+import hashlib
+import operator
+import re
 import time
 import logging
+from collections import OrderedDict
 from datetime import datetime, date
-from typing import Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple
 
-try:
-    from huggingface_hub import InferenceClient
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
+from .http_session import get_session, encode_json, decode_json
+from .timestamps import next_local_midnight
 
 logger = logging.getLogger(__name__)
 
+SENTIMENT_LABELS = ("negative", "neutral", "positive")
+SENTIMENT_FAKE_WEIGHTS = (0.85, 0.15, 0.4)
+
+MIN_TEXT_LENGTH = 8
+NON_CONTENT_PATTERN = re.compile(r'https?://\S+|[\d\W_]+')
+
 class QuotaExceededError(Exception):
     
     pass
@@ -23,36 +30,51 @@ class HuggingFaceClient:
     
     
     MODEL_ID = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+    API_URL = f"https://router.huggingface.co/hf-inference/models/{MODEL_ID}"
+    RESULT_CACHE_SIZE = 2048
+    BATCH_SIZE = 16
+    BATCH_WINDOW = 0.02
+    MAX_CONCURRENT_REQUESTS = 8
     
     def __init__(
         self,
         api_key: str,
         daily_quota: int = 30000,
-        timeout: int = 10
+        timeout: int = 10,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         self.api_key = api_key
         self.daily_quota = daily_quota
         self.timeout = timeout
         self.usage_today = 0
         self.last_reset_date = date.today()
+        self._next_reset_ts = next_local_midnight()
         self.last_success_time: Optional[datetime] = None
         self.success_count = 0
         self.error_count = 0
-        self._total_latency = 0.0
-        self._executor = ThreadPoolExecutor(max_workers=2)
-        
-        if HF_AVAILABLE and api_key:
-            self._client = InferenceClient(token=api_key)
-        else:
-            self._client = None
+        self._total_latency_ns = 0
+        self._session = session
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
         
         logger.info(f"HuggingFaceClient initialized with sentiment model")
     
     def _check_quota_reset(self) -> None:
+        if time.time() < self._next_reset_ts:
+            return
         today = date.today()
         if today > self.last_reset_date:
             self.usage_today = 0
             self.last_reset_date = today
+        self._next_reset_ts = next_local_midnight()
     
     def _check_quota(self) -> None:
         self._check_quota_reset()
@@ -60,7 +82,7 @@ class HuggingFaceClient:
             raise QuotaExceededError(f"HuggingFace quota exceeded")
     
     def is_available(self) -> bool:
-        if not self.api_key or not HF_AVAILABLE or not self._client:
+        if not self.api_key:
             return False
         self._check_quota_reset()
         return self.usage_today < self.daily_quota
@@ -81,40 +103,133 @@ class HuggingFaceClient:
             "status": "healthy" if self.is_available() else "unavailable",
             "last_success": self.last_success_time.isoformat() if self.last_success_time else None,
             "success_rate": (self.success_count / total_requests * 100) if total_requests > 0 else 100,
-            "avg_latency": (self._total_latency / self.success_count) if self.success_count > 0 else 0,
+            "avg_latency": (self._total_latency_ns / 1e9 / self.success_count) if self.success_count > 0 else 0,
             "quota": self.get_quota_usage()
         }
     
-    def _sync_classify(self, text: str) -> Any:
-        return self._client.text_classification(
-            text[:512],
-            model=self.MODEL_ID
-        )
+    async def _make_request(self, texts: List[str]) -> Any:
+        session = self._session or get_session()
+        async with session.post(
+            self.API_URL,
+            data=encode_json({"inputs": texts[0] if len(texts) == 1 else texts}),
+            headers=self._headers,
+            timeout=self._client_timeout
+        ) as response:
+            if response.status == 429:
+                raise QuotaExceededError("HuggingFace rate limit exceeded")
+            elif response.status != 200:
+                error_text = await response.text()
+                raise aiohttp.ClientError(f"API error {response.status}: {error_text}")
+            
+            return decode_json(await response.read())
+    
+    def _get_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._queue_loop is not loop:
+            self.close()
+            self._queue = asyncio.Queue()
+            self._queue_loop = loop
+            inflight = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            self._worker = loop.create_task(self._batch_worker(self._queue, inflight))
+        return self._queue
+    
+    async def _classify(self, text: str) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait((text[:512], future))
+        return await future
+    
+    async def _collect_batch(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.BATCH_WINDOW
+        while len(batch) < self.BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return [(text, future) for text, future in batch if not future.done()]
+    
+    async def _batch_worker(self, queue: asyncio.Queue, inflight: asyncio.Semaphore) -> None:
+        while True:
+            batch = await self._collect_batch(queue)
+            if not batch:
+                continue
+            
+            await inflight.acquire()
+            task = asyncio.get_running_loop().create_task(self._dispatch_batch(batch, inflight))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch_batch(self, batch: List[Tuple[str, asyncio.Future]], inflight: asyncio.Semaphore) -> None:
+        try:
+            response = await self._make_request([text for text, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            inflight.release()
+        
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index < len(response):
+                future.set_result(response[index])
+            else:
+                future.set_exception(ValueError("HuggingFace response is missing batch results"))
+    
+    def close(self) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for task in [self._worker, *self._dispatches]:
+            if task is None or task.done() or task.get_loop().is_closed():
+                continue
+            if task.get_loop() is running:
+                task.cancel()
+            else:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+        self._dispatches.clear()
+        self._queue = None
+        self._queue_loop = None
+        self._worker = None
     
     async def predict(self, text: str) -> Dict[str, Any]:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        
+        stripped = text.strip()
+        if len(stripped) < MIN_TEXT_LENGTH or NON_CONTENT_PATTERN.fullmatch(stripped):
+            return self._skipped_result()
+        
+        key = hashlib.blake2b(text[:512].encode('utf-8'), digest_size=16).hexdigest()
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return {**cached, "processing_time": 0.0, "cached": True}
         
         try:
             self._check_quota()
-            
-            if not self._client:
-                raise RuntimeError("HuggingFace client not initialized")
-            
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(self._executor, self._sync_classify, text),
-                timeout=self.timeout
-            )
+            response = await self._classify(text)
             
             self.usage_today += 1
             result = self._parse_response(response)
-            processing_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = elapsed_ns / 1e9
             
             self.success_count += 1
             self.last_success_time = datetime.now()
-            self._total_latency += processing_time
+            self._total_latency_ns += elapsed_ns
             
-            return {
+            prediction = {
                 "model_name": "huggingface",
                 "fake_probability": result["fake_probability"],
                 "confidence": result["confidence"],
@@ -123,6 +238,12 @@ class HuggingFaceClient:
                 "raw_response": str(response)
             }
             
+            self._result_cache[key] = prediction
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            
+            return dict(prediction)
+            
         except QuotaExceededError:
             self.error_count += 1
             raise
@@ -131,36 +252,32 @@ class HuggingFaceClient:
             logger.error(f"HuggingFace prediction failed: {e}")
             raise
     
+    def _skipped_result(self) -> Dict[str, Any]:
+        
+        return {
+            "model_name": "huggingface",
+            "fake_probability": 0.5,
+            "confidence": 0.0,
+            "processing_time": 0.0,
+            "sentiment": "unknown",
+            "raw_response": "skipped: no classifiable content"
+        }
+    
     def _parse_response(self, response: Any) -> Dict[str, float]:
         
         try:
-            scores = {}
-            for item in response:
-                label = getattr(item, 'label', '').lower()
-                score = getattr(item, 'score', 0.0)
-                scores[label] = score
-            
-            negative = scores.get('negative', 0.0)
-            neutral = scores.get('neutral', 0.0)
-            positive = scores.get('positive', 0.0)
+            if response and isinstance(response[0], list):
+                response = response[0]
             
-            fake_probability = (
-                negative * 0.85 +
-                positive * 0.4 +
-                neutral * 0.15
-            )
+            by_label = {item['label'].lower(): item['score'] for item in response}
+            scores = [by_label.get(label, 0.0) for label in SENTIMENT_LABELS]
             
+            fake_probability = sum(map(operator.mul, scores, SENTIMENT_FAKE_WEIGHTS))
             fake_probability = max(0.0, min(1.0, fake_probability))
             
-            max_score = max(negative, neutral, positive)
-            confidence = max_score
-            
-            if negative >= neutral and negative >= positive:
-                sentiment = "negative"
-            elif neutral >= negative and neutral >= positive:
-                sentiment = "neutral"
-            else:
-                sentiment = "positive"
+            best = max(range(len(scores)), key=scores.__getitem__)
+            confidence = scores[best]
+            sentiment = SENTIMENT_LABELS[best]
             
             return {
                 "fake_probability": round(fake_probability, 4),
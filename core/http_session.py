@@ -0,0 +1,172 @@
+
+
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import aiohttp
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 32
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+MAX_ATTEMPTS = 3
+BACKOFF_MAX = 30.0
+RETRY_AFTER_CAP = 5.0
+RETRY_AFTER_JITTER = 0.5
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_stale_closes: Set[asyncio.Task] = set()
+
+def get_session() -> aiohttp.ClientSession:
+    
+    global _session, _session_loop
+    
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            _close_stale_session(_session, _session_loop, loop)
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True
+        )
+        _session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+        _session_loop = loop
+        logger.debug("Opened shared HTTP session")
+    
+    return _session
+
+def _close_stale_session(
+    session: aiohttp.ClientSession,
+    session_loop: asyncio.AbstractEventLoop,
+    loop: asyncio.AbstractEventLoop
+) -> None:
+    
+    if session_loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+    else:
+        task = loop.create_task(session.close())
+        _stale_closes.add(task)
+        task.add_done_callback(_stale_closes.discard)
+    logger.debug("Closing HTTP session left over from a previous event loop")
+
+async def close_session() -> None:
+    
+    global _session, _session_loop
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.debug("Closed shared HTTP session")
+    _session = None
+    _session_loop = None
+
+def backoff_delay(attempt: int) -> float:
+    
+    return random.uniform(0, min(BACKOFF_MAX, 2 ** attempt))
+
+def retry_after_delay(headers: Mapping[str, str]) -> Optional[float]:
+    
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    
+    if delay > RETRY_AFTER_CAP:
+        return None
+    return max(delay, 0.0) + random.uniform(0, RETRY_AFTER_JITTER)
+
+def encode_json(payload: Any) -> bytes:
+    
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def decode_json(body: bytes) -> Any:
+    
+    try:
+        return _loads(body)
+    except ValueError:
+        if not isinstance(body, (bytes, bytearray)):
+            raise
+        return _loads(body.decode('utf-8', errors='replace'))
+
+def _loads(body: Any) -> Any:
+    
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    
+    try:
+        result = decode_json(text)
+    except ValueError:
+        result = _scan_first_object(text)
+    return result if isinstance(result, dict) else None
+
+def parse_result_list(text: str) -> List[Any]:
+    
+    try:
+        result = decode_json(text)
+    except ValueError:
+        result = _scan_first_object(text)
+    if isinstance(result, dict):
+        result = result.get("results")
+    return result if isinstance(result, list) else []
+
+def _scan_first_object(text: str) -> Optional[Any]:
+    
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                try:
+                    return decode_json(text[start:index + 1])
+                except ValueError:
+                    return None
+    return None
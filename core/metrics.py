@@ -1,25 +1,23 @@
 
 
 import logging
+import time
+import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
-from collections import deque
-import statistics
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from collections import Counter, deque
+from itertools import islice
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class PredictionRecord:
-    
-    timestamp: datetime
-    prediction: str
-    fake_probability: float
-    confidence: float
-    processing_time: float
-    models_used: List[str]
-    cached: bool
-    text_preview: str
+PREDICTION_LABELS = ("FAKE", "REAL", "UNCERTAIN")
+PREDICTION_CODES = {label: code for code, label in enumerate(PREDICTION_LABELS)}
+
+CONFIDENCE_BIN_EDGES = np.linspace(0.0, 1.0, 11)
+LATENCY_BIN_EDGES = np.logspace(-3, 2, 21)
 
 @dataclass
 class ErrorRecord:
@@ -41,9 +39,10 @@ class MetricsTracker:
         
         self.max_predictions = max_predictions
         self.max_errors = max_errors
-        self.predictions: deque = deque(maxlen=max_predictions)
         self.errors: deque = deque(maxlen=max_errors)
         self.session_start = datetime.now()
+        self.tracker_id = uuid.uuid4().hex
+        self.version = 0
         
         self._total_predictions = 0
         self._total_fake = 0
@@ -52,6 +51,22 @@ class MetricsTracker:
         self._total_cached = 0
         self._total_latency = 0.0
         
+        self._timestamps = np.zeros(max_predictions, dtype=np.float64)
+        self._predictions = np.zeros(max_predictions, dtype=np.uint8)
+        self._fake_probabilities = np.zeros(max_predictions, dtype=np.float64)
+        self._confidences = np.zeros(max_predictions, dtype=np.float64)
+        self._latencies = np.zeros(max_predictions, dtype=np.float64)
+        self._cached = np.zeros(max_predictions, dtype=bool)
+        self._models_used: List[List[str]] = [[] for _ in range(max_predictions)]
+        self._text_previews: List[str] = [""] * max_predictions
+        self._index = 0
+        self._count = 0
+        
+        self._confidence_sum = 0.0
+        self._confidence_hist = np.zeros(len(CONFIDENCE_BIN_EDGES) - 1, dtype=np.int64)
+        self._latency_hist = np.zeros(len(LATENCY_BIN_EDGES) - 1, dtype=np.int64)
+        self._model_usage: Counter = Counter()
+        
         logger.info("MetricsTracker initialized")
     
     def record_prediction(
@@ -61,33 +76,53 @@ class MetricsTracker:
     ) -> None:
         
         try:
-            record = PredictionRecord(
-                timestamp=datetime.now(),
-                prediction=result.get("prediction", "UNCERTAIN"),
-                fake_probability=result.get("fake_probability", 0.5),
-                confidence=result.get("confidence", 0.5),
-                processing_time=result.get("processing_time", 0.0),
-                models_used=result.get("models_used", []),
-                cached=result.get("cached", False),
-                text_preview=text[:100] + "..." if len(text) > 100 else text
-            )
+            prediction = result.get("prediction", "UNCERTAIN")
+            code = PREDICTION_CODES.get(prediction, PREDICTION_CODES["UNCERTAIN"])
+            confidence = result.get("confidence", 0.5)
+            processing_time = result.get("processing_time", 0.0)
+            cached = bool(result.get("cached", False))
+            models_used = result.get("models_used", [])
             
-            self.predictions.append(record)
+            i = self._index
+            if self._count == self.max_predictions:
+                self._confidence_sum -= self._confidences[i]
+                self._confidence_hist[self._confidence_bin(self._confidences[i])] -= 1
+                self._latency_hist[self._latency_bin(self._latencies[i])] -= 1
+                self._model_usage.subtract(self._models_used[i])
+            
+            self._confidence_sum += confidence
+            self._confidence_hist[self._confidence_bin(confidence)] += 1
+            self._latency_hist[self._latency_bin(processing_time)] += 1
+            self._model_usage.update(models_used)
+            
+            self._timestamps[i] = time.time()
+            self._predictions[i] = code
+            self._fake_probabilities[i] = result.get("fake_probability", 0.5)
+            self._confidences[i] = confidence
+            self._latencies[i] = processing_time
+            self._cached[i] = cached
+            self._models_used[i] = models_used
+            self._text_previews[i] = text[:100] + "..." if len(text) > 100 else text
+            self._index = (i + 1) % self.max_predictions
+            self._count = min(self._count + 1, self.max_predictions)
+            if self._index == 0:
+                self._confidence_sum = float(self._confidences.sum())
             
             self._total_predictions += 1
-            self._total_latency += record.processing_time
+            self._total_latency += processing_time
             
-            if record.prediction == "FAKE":
+            if code == PREDICTION_CODES["FAKE"]:
                 self._total_fake += 1
-            elif record.prediction == "REAL":
+            elif code == PREDICTION_CODES["REAL"]:
                 self._total_real += 1
             else:
                 self._total_uncertain += 1
             
-            if record.cached:
+            if cached:
                 self._total_cached += 1
             
-            logger.debug(f"Recorded prediction: {record.prediction}")
+            self.version += 1
+            logger.debug("Recorded prediction: %s", prediction)
             
         except Exception as e:
             logger.error(f"Failed to record prediction: {e}")
@@ -109,7 +144,8 @@ class MetricsTracker:
             )
             
             self.errors.append(record)
-            logger.debug(f"Recorded {severity} in {component}: {error}")
+            self.version += 1
+            logger.debug("Recorded %s in %s: %s", severity, component, error)
             
         except Exception as e:
             logger.error(f"Failed to record error: {e}")
@@ -141,61 +177,72 @@ class MetricsTracker:
             "real_percentage": round(self._total_real / total * 100, 1),
             "uncertain_percentage": round(self._total_uncertain / total * 100, 1),
             "avg_confidence": round(
-                sum(p.confidence for p in self.predictions) / len(self.predictions), 4
-            ) if self.predictions else 0,
+                float(self._confidence_sum) / self._count, 4
+            ) if self._count else 0,
             "avg_latency": round(self._total_latency / total, 4),
             "cache_hit_rate": round(self._total_cached / total * 100, 1)
         }
     
     def get_latency_percentiles(self) -> Dict[str, float]:
         
-        if not self.predictions:
+        if self._count == 0:
             return {"p50": 0, "p95": 0, "p99": 0}
         
-        latencies = sorted(p.processing_time for p in self.predictions)
-        n = len(latencies)
-        
-        def percentile(p):
-            k = (n - 1) * (p / 100)
-            f = int(k)
-            c = min(f + 1, n - 1)
-            if f == c:
-                return latencies[f]
-            return latencies[f] * (c - k) + latencies[c] * (k - f)
+        p50, p95, p99 = np.percentile(self._latencies[:self._count], [50, 95, 99])
         
         return {
-            "p50": round(percentile(50), 4),
-            "p95": round(percentile(95), 4),
-            "p99": round(percentile(99), 4)
+            "p50": round(float(p50), 4),
+            "p95": round(float(p95), 4),
+            "p99": round(float(p99), 4)
         }
     
+    def __len__(self) -> int:
+        
+        return self._count
+    
+    def get_confidence_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        
+        return self._confidence_hist.copy(), CONFIDENCE_BIN_EDGES
+    
+    def get_latency_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        
+        return self._latency_hist.copy(), LATENCY_BIN_EDGES
+    
+    def _confidence_bin(self, confidence: float) -> int:
+        
+        return min(max(int(confidence * 10), 0), len(self._confidence_hist) - 1)
+    
+    def _latency_bin(self, latency: float) -> int:
+        
+        index = int(np.searchsorted(LATENCY_BIN_EDGES, latency, side='right')) - 1
+        return min(max(index, 0), len(self._latency_hist) - 1)
+    
     def get_recent_predictions(self, limit: int = 10) -> List[Dict[str, Any]]:
         
-        recent = list(self.predictions)[-limit:]
-        recent.reverse()
+        recent = [
+            (self._index - 1 - offset) % self.max_predictions
+            for offset in range(min(limit, self._count))
+        ]
         
         return [
             {
-                "timestamp": p.timestamp.isoformat(),
-                "prediction": p.prediction,
-                "fake_probability": p.fake_probability,
-                "confidence": p.confidence,
-                "processing_time": p.processing_time,
-                "models_used": p.models_used,
-                "cached": p.cached,
-                "text_preview": p.text_preview
+                "timestamp": datetime.fromtimestamp(self._timestamps[i]).isoformat(),
+                "prediction": PREDICTION_LABELS[self._predictions[i]],
+                "fake_probability": float(self._fake_probabilities[i]),
+                "confidence": float(self._confidences[i]),
+                "processing_time": float(self._latencies[i]),
+                "models_used": self._models_used[i],
+                "cached": bool(self._cached[i]),
+                "text_preview": self._text_previews[i]
             }
-            for p in recent
+            for i in recent
         ]
     
     def get_recent_errors(self, limit: int = 20, severity: Optional[str] = None) -> List[Dict[str, Any]]:
         
-        errors = list(self.errors)
+        errors = reversed(self.errors)
         if severity:
-            errors = [e for e in errors if e.severity == severity]
-        
-        errors.reverse()
-        errors = errors[:limit]
+            errors = (e for e in errors if e.severity == severity)
         
         return [
             {
@@ -205,7 +252,7 @@ class MetricsTracker:
                 "component": e.component,
                 "details": e.details
             }
-            for e in errors
+            for e in islice(errors, limit)
         ]
     
     def get_session_info(self) -> Dict[str, Any]:
@@ -225,11 +272,7 @@ class MetricsTracker:
     
     def get_model_usage(self) -> Dict[str, int]:
         
-        usage = {}
-        for p in self.predictions:
-            for model in p.models_used:
-                usage[model] = usage.get(model, 0) + 1
-        return usage
+        return {model: count for model, count in self._model_usage.items() if count > 0}
     
     def get_all_stats(self) -> Dict[str, Any]:
         
@@ -0,0 +1,63 @@
+
+
+import asyncio
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_FACTOR = 1.25
+MIN_RATE_DIVISOR = 4
+
+class ClientTokenBucket:
+    
+    def __init__(self, rate: float, capacity: int, min_rate: Optional[float] = None):
+        
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / MIN_RATE_DIVISOR
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self) -> asyncio.Lock:
+        
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    def _refill(self) -> None:
+        
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, max_wait: Optional[float] = None) -> bool:
+        
+        async with self._get_lock():
+            self._refill()
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            if max_wait is not None and wait >= max_wait:
+                return False
+            if wait > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+            return True
+    
+    def decrease(self, drain: bool = True) -> None:
+        
+        self.rate = max(self.rate * RATE_DECREASE_FACTOR, self.min_rate)
+        if drain:
+            self.tokens = min(self.tokens, 0.0)
+        logger.warning(f"Rate limited, reducing request rate to {self.rate:.3f}/s")
+    
+    def increase(self) -> None:
+        
+        self.rate = min(self.rate * RATE_INCREASE_FACTOR, self.max_rate)
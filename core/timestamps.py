@@ -0,0 +1,24 @@
+
+
+import time
+from datetime import datetime, date, time as day_start, timedelta
+from functools import lru_cache
+from typing import Optional
+
+@lru_cache(maxsize=4)
+def _iso_second(second: int) -> str:
+    
+    return datetime.fromtimestamp(second).isoformat()
+
+def iso_timestamp(seconds: Optional[float] = None) -> str:
+    
+    if seconds is None:
+        seconds = time.time()
+    return _iso_second(int(seconds))
+
+def next_local_midnight(seconds: Optional[float] = None) -> float:
+    
+    if seconds is None:
+        seconds = time.time()
+    tomorrow = date.fromtimestamp(seconds) + timedelta(days=1)
+    return datetime.combine(tomorrow, day_start.min).timestamp()
@@ -3,12 +3,14 @@
 import aiohttp
 import asyncio
 import time
-import json
-import re
 import logging
 from datetime import datetime, date
 from typing import Dict, Any, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+from .http_session import get_session, encode_json, decode_json, extract_json_object
+from .http_session import MAX_ATTEMPTS, backoff_delay, retry_after_delay
+from .rate_limiter import ClientTokenBucket
+from .timestamps import next_local_midnight
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,8 @@ class TogetherClient:
     
     API_URL = "https://api.together.xyz/v1/chat/completions"
     MODEL_ID = "meta-llama/Llama-3.1-8B-Instruct-Turbo"
+    RATE_LIMIT_PER_SECOND = 1.0
+    RATE_LIMIT_BURST = 10
     
     SYSTEM_PROMPT = 
 
@@ -30,7 +34,8 @@ class TogetherClient:
         self,
         api_key: str,
         daily_quota: int = 1000,
-        timeout: int = 10
+        timeout: int = 10,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         
         self.api_key = api_key
@@ -38,20 +43,41 @@ class TogetherClient:
         self.timeout = timeout
         self.usage_today = 0
         self.last_reset_date = date.today()
+        self._next_reset_ts = next_local_midnight()
         self.last_success_time: Optional[datetime] = None
         self.success_count = 0
         self.error_count = 0
-        self._total_latency = 0.0
+        self._total_latency_ns = 0
+        self._session = session
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self._bucket = ClientTokenBucket(self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST)
+        self._payload_template = {
+            "model": self.MODEL_ID,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": None}
+            ],
+            "max_tokens": 500,
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"}
+        }
         
         logger.info(f"TogetherClient initialized with quota {daily_quota}")
     
     def _check_quota_reset(self) -> None:
         
+        if time.time() < self._next_reset_ts:
+            return
+        
         today = date.today()
         if today > self.last_reset_date:
             logger.info(f"Resetting Together.ai quota (new day: {today})")
             self.usage_today = 0
             self.last_reset_date = today
+        self._next_reset_ts = next_local_midnight()
     
     def _check_quota(self) -> None:
         
@@ -87,49 +113,56 @@ class TogetherClient:
             "status": "healthy" if self.is_available() else "unavailable",
             "last_success": self.last_success_time.isoformat() if self.last_success_time else None,
             "success_rate": (self.success_count / total_requests * 100) if total_requests > 0 else 100,
-            "avg_latency": (self._total_latency / self.success_count) if self.success_count > 0 else 0,
+            "avg_latency": (self._total_latency_ns / 1e9 / self.success_count) if self.success_count > 0 else 0,
             "quota": self.get_quota_usage()
         }
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-        reraise=True
-    )
     async def _make_request(self, text: str) -> Dict[str, Any]:
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        payload = self._payload_template
+        payload["messages"][1]["content"] = self.USER_PROMPT_TEMPLATE.format(text=text[:3000])
+        body = encode_json(payload)
         
-        payload = {
-            "model": self.MODEL_ID,
-            "messages": [
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": self.USER_PROMPT_TEMPLATE.format(text=text[:3000])}
-            ],
-            "max_tokens": 500,
-            "temperature": 0.1,
-            "response_format": {"type": "json_object"}
-        }
-        
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(self.API_URL, json=payload, headers=headers) as response:
-                if response.status == 429:
-                    raise QuotaExceededError("Rate limit exceeded")
-                elif response.status != 200:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if not await self._bucket.acquire(max_wait=deadline - loop.time()):
+                raise QuotaExceededError("Client rate limit leaves no time for the request")
+            session = self._session or get_session()
+            try:
+                async with session.post(
+                    self.API_URL,
+                    data=body,
+                    headers=self._headers,
+                    timeout=aiohttp.ClientTimeout(total=deadline - loop.time())
+                ) as response:
+                    if response.status == 200:
+                        self._bucket.increase()
+                        return decode_json(await response.read())
+                    status = response.status
+                    retry_after = retry_after_delay(response.headers)
                     error_text = await response.text()
-                    raise aiohttp.ClientError(f"API error {response.status}: {error_text}")
-                
-                return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                delay = backoff_delay(attempt)
+                if attempt == MAX_ATTEMPTS or loop.time() + delay >= deadline:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            
+            if status == 429:
+                self._bucket.decrease(drain=retry_after is None)
+                if retry_after is None or attempt == MAX_ATTEMPTS or loop.time() + retry_after >= deadline:
+                    raise QuotaExceededError("Rate limit exceeded")
+                await asyncio.sleep(retry_after)
+            else:
+                delay = backoff_delay(attempt)
+                if status < 500 or attempt == MAX_ATTEMPTS or loop.time() + delay >= deadline:
+                    raise aiohttp.ClientError(f"API error {status}: {error_text}")
+                await asyncio.sleep(delay)
     
     async def predict(self, text: str) -> Dict[str, Any]:
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             self._check_quota()
@@ -140,11 +173,12 @@ class TogetherClient:
             
             result = self._parse_response(response)
             
-            processing_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = elapsed_ns / 1e9
             
             self.success_count += 1
             self.last_success_time = datetime.now()
-            self._total_latency += processing_time
+            self._total_latency_ns += elapsed_ns
             
             return {
                 "model_name": "together",
@@ -162,50 +196,45 @@ class TogetherClient:
             raise
         except Exception as e:
             self.error_count += 1
-            processing_time = time.time() - start_time
             logger.error(f"Together.ai prediction failed: {e}")
             raise
     
     def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         
+        choices = response.get("choices")
+        if not choices:
+            return self._default_result()
+        
+        try:
+            content = choices[0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            return self._default_result()
+        
+        if not content or not isinstance(content, str):
+            return self._default_result()
+        
+        result = extract_json_object(content)
+        if result is None:
+            logger.warning(f"Could not parse Together.ai response as JSON: {content[:200]}")
+            return self._default_result()
+        
         try:
-            choices = response.get("choices", [])
-            if not choices:
-                return self._default_result()
-            
-            message = choices[0].get("message", {})
-            content = message.get("content", "")
-            
-            if not content:
-                return self._default_result()
-            
-            try:
-                result = json.loads(content)
-            except json.JSONDecodeError:
-                json_match = re.search(r'\{[^{}]*\}', content, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    logger.warning(f"Could not parse Together.ai response as JSON: {content[:200]}")
-                    return self._default_result()
-            
             fake_probability = float(result.get("fake_probability", 0.5))
             confidence = float(result.get("confidence", 0.5))
-            
-            fake_probability = max(0.0, min(1.0, fake_probability))
-            confidence = max(0.0, min(1.0, confidence))
-            
-            return {
-                "fake_probability": round(fake_probability, 4),
-                "confidence": round(confidence, 4),
-                "reasoning": result.get("reasoning", ""),
-                "red_flags": result.get("red_flags", []),
-                "credibility_signals": result.get("credibility_signals", [])
-            }
-            
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to parse Together.ai response: {e}")
             return self._default_result()
+        
+        fake_probability = max(0.0, min(1.0, fake_probability))
+        confidence = max(0.0, min(1.0, confidence))
+        
+        return {
+            "fake_probability": round(fake_probability, 4),
+            "confidence": round(confidence, 4),
+            "reasoning": result.get("reasoning", ""),
+            "red_flags": result.get("red_flags", []),
+            "credibility_signals": result.get("credibility_signals", [])
+        }
     
     def _default_result(self) -> Dict[str, Any]:
         
@@ -1,11 +1,8 @@
 
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
 from datetime import datetime
-from components.shared_styles import inject_styles, render_sidebar_branding
+from components.shared_styles import inject_styles, render_sidebar_branding, render_page_header
 
 st.set_page_config(
     page_title="Analytics - Fake News Detection",
@@ -18,18 +15,70 @@ inject_styles()
 with st.sidebar:
     render_sidebar_branding()
 
-st.markdown('<div class="logo-symbol">⊹</div>', unsafe_allow_html=True)
-st.markdown('<h1 class="main-header">Analytics & History</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">View your session statistics and prediction history</p>', unsafe_allow_html=True)
+render_page_header(
+    "Analytics & History",
+    "View your session statistics and prediction history"
+)
 
 if 'metrics_tracker' not in st.session_state:
     st.warning("No session data available. Please analyze some articles first.")
     st.info("Go to the main page to start analyzing articles.")
     st.stop()
 
+import plotly.graph_objects as go
+import pandas as pd
+import numpy as np
+
+from components.plotly_json import use_orjson_engine
+
+use_orjson_engine()
+
+@st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+def load_analytics(_tracker, tracker_id: str, version: int) -> dict:
+    
+    recent = _tracker.get_recent_predictions(limit=10)
+    recent_table = None
+    
+    if recent:
+        df = pd.DataFrame(recent)
+        
+        df['Time'] = pd.to_datetime(df['timestamp']).dt.strftime('%H:%M:%S')
+        prediction = df['prediction'].astype(str)
+        df['Verdict'] = np.where(prediction.isin(['FAKE', 'REAL']), "[" + prediction + "] ", "[?] ") + prediction
+        df['Fake %'] = np.char.mod('%.0f%%', df['fake_probability'].to_numpy() * 100)
+        df['Conf %'] = np.char.mod('%.0f%%', df['confidence'].to_numpy() * 100)
+        latency = df['processing_time'].to_numpy()
+        df['Latency'] = np.where(
+            latency < 1,
+            np.char.mod('%.0fms', latency * 1000),
+            np.char.mod('%.2fs', latency)
+        )
+        df['Cached'] = np.where(df['cached'], "Yes", "No")
+        preview = df['text_preview']
+        df['Preview'] = np.where(preview.str.len() > 50, preview.str.slice(0, 50) + "...", preview)
+        
+        recent_table = df[['Time', 'Verdict', 'Fake %', 'Conf %', 'Latency', 'Cached', 'Preview']]
+    
+    return {
+        "stats": _tracker.get_prediction_stats(),
+        "model_usage": _tracker.get_model_usage(),
+        "recent": recent,
+        "recent_table": recent_table,
+        "latency": _tracker.get_latency_percentiles(),
+        "latency_histogram": _tracker.get_latency_histogram(),
+        "confidence_histogram": _tracker.get_confidence_histogram(),
+        "count": len(_tracker)
+    }
+
+analytics = load_analytics(
+    st.session_state.metrics_tracker,
+    st.session_state.metrics_tracker.tracker_id,
+    st.session_state.metrics_tracker.version
+)
+
 st.header("Session Statistics")
 
-stats = st.session_state.metrics_tracker.get_prediction_stats()
+stats = analytics["stats"]
 
 col1, col2, col3, col4 = st.columns(4)
 
@@ -106,7 +155,7 @@ if stats['total_predictions'] > 0:
 
 st.header("Model Usage")
 
-model_usage = st.session_state.metrics_tracker.get_model_usage()
+model_usage = analytics["model_usage"]
 
 if model_usage:
     models = list(model_usage.keys())
@@ -142,27 +191,11 @@ else:
 
 st.header("Recent Predictions")
 
-recent = st.session_state.metrics_tracker.get_recent_predictions(limit=10)
+recent = analytics["recent"]
 
 if recent:
-    df = pd.DataFrame(recent)
-    
-    df['Time'] = pd.to_datetime(df['timestamp']).dt.strftime('%H:%M:%S')
-    df['Verdict'] = df['prediction'].apply(
-        lambda x: f"[{'FAKE' if x == 'FAKE' else 'REAL' if x == 'REAL' else '?'}] {x}"
-    )
-    df['Fake %'] = df['fake_probability'].apply(lambda x: f"{x * 100:.0f}%")
-    df['Conf %'] = df['confidence'].apply(lambda x: f"{x * 100:.0f}%")
-    df['Latency'] = df['processing_time'].apply(
-        lambda x: f"{x * 1000:.0f}ms" if x < 1 else f"{x:.2f}s"
-    )
-    df['Cached'] = df['cached'].apply(lambda x: "Yes" if x else "No")
-    df['Preview'] = df['text_preview'].apply(lambda x: x[:50] + "..." if len(x) > 50 else x)
-    
-    display_df = df[['Time', 'Verdict', 'Fake %', 'Conf %', 'Latency', 'Cached', 'Preview']]
-    
     st.dataframe(
-        display_df,
+        analytics["recent_table"],
         use_container_width=True,
         hide_index=True
     )
@@ -178,7 +211,7 @@ else:
 
 st.header("Performance Metrics")
 
-latency = st.session_state.metrics_tracker.get_latency_percentiles()
+latency = analytics["latency"]
 
 col1, col2, col3 = st.columns(3)
 
@@ -189,32 +222,34 @@ with col2:
 with col3:
     st.metric("P99 Latency", f"{latency['p99'] * 1000:.0f}ms")
 
-if len(list(st.session_state.metrics_tracker.predictions)) > 3:
-    latencies = [p.processing_time for p in st.session_state.metrics_tracker.predictions]
+if analytics["count"] > 3:
+    latency_counts, latency_edges = analytics["latency_histogram"]
     
-    fig = go.Figure(data=[go.Histogram(
-        x=latencies,
-        nbinsx=20,
+    fig = go.Figure(data=[go.Bar(
+        x=[f"{edge * 1000:.0f}ms" if edge < 1 else f"{edge:.1f}s" for edge in latency_edges[:-1]],
+        y=latency_counts,
         marker_color='#3b82f6'
     )])
     
     fig.update_layout(
         title="Latency Distribution",
-        xaxis_title="Processing Time (seconds)",
+        xaxis_title="Processing Time",
         yaxis_title="Count",
         height=300
     )
     
     st.plotly_chart(fig, use_container_width=True)
 
-if len(list(st.session_state.metrics_tracker.predictions)) > 3:
+if analytics["count"] > 3:
     st.header("Confidence Distribution")
     
-    confidences = [p.confidence for p in st.session_state.metrics_tracker.predictions]
+    confidence_counts, confidence_edges = analytics["confidence_histogram"]
     
-    fig = go.Figure(data=[go.Histogram(
-        x=confidences,
-        nbinsx=10,
+    fig = go.Figure(data=[go.Bar(
+        x=confidence_edges[:-1],
+        y=confidence_counts,
+        width=0.1,
+        offset=0,
         marker_color='#10b981'
     )])
     
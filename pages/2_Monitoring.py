@@ -3,13 +3,7 @@
 import streamlit as st
 from datetime import datetime
 
-from components.system_health import (
-    display_system_health,
-    display_quota_management,
-    display_error_log,
-    display_performance_metrics
-)
-from components.shared_styles import inject_styles, render_sidebar_branding
+from components.shared_styles import inject_styles, render_sidebar_branding, render_page_header
 
 st.set_page_config(
     page_title="Monitoring - Fake News Detection",
@@ -22,14 +16,27 @@ inject_styles()
 with st.sidebar:
     render_sidebar_branding()
 
-st.markdown('<div class="logo-symbol">⊹</div>', unsafe_allow_html=True)
-st.markdown('<h1 class="main-header">System Monitoring</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Real-time system health and performance monitoring</p>', unsafe_allow_html=True)
+render_page_header(
+    "System Monitoring",
+    "Real-time system health and performance monitoring"
+)
 
 if 'ensemble' not in st.session_state:
     st.warning("System not initialized. Please visit the main page first.")
     st.stop()
 
+from components.system_health import (
+    display_system_health,
+    display_quota_management,
+    display_error_log,
+    display_performance_metrics
+)
+
+@st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+def load_recent_errors(_tracker, tracker_id: str, version: int, limit: int = 10) -> list:
+    
+    return _tracker.get_recent_errors(limit=limit)
+
 st.header("System Health")
 
 health_data = st.session_state.ensemble.get_system_health()
@@ -160,7 +167,11 @@ else:
 st.header("Recent Errors")
 
 if 'metrics_tracker' in st.session_state:
-    errors = st.session_state.metrics_tracker.get_recent_errors(limit=10)
+    errors = load_recent_errors(
+        st.session_state.metrics_tracker,
+        st.session_state.metrics_tracker.tracker_id,
+        st.session_state.metrics_tracker.version
+    )
     
     if errors:
         for error in errors:
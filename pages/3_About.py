@@ -1,5 +1,5 @@
 import streamlit as st
-from components.shared_styles import inject_styles, render_sidebar_branding
+from components.shared_styles import inject_styles, render_sidebar_branding, render_page_header
 
 st.set_page_config(
     page_title="About - Fake News Detection",
@@ -12,9 +12,10 @@ inject_styles()
 with st.sidebar:
     render_sidebar_branding()
 
-st.markdown('<div class="logo-symbol">⊹</div>', unsafe_allow_html=True)
-st.markdown('<h1 class="main-header">About This System</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Learn how the Fake News Detection AI works</p>', unsafe_allow_html=True)
+render_page_header(
+    "About This System",
+    "Learn how the Fake News Detection AI works"
+)
 
 st.header("System Overview")
 
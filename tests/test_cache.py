@@ -5,6 +5,7 @@ import sys
 import os
 import json
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -18,8 +19,9 @@ def temp_cache_file():
     fd, path = tempfile.mkstemp(suffix='.json')
     os.close(fd)
     yield path
-    if os.path.exists(path):
-        os.remove(path)
+    for leftover in (path, f"{path}.log", f"{path}.tmp"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
 
 @pytest.fixture
 def cache_manager(temp_cache_file):
@@ -41,6 +43,20 @@ class TestCacheBasicOperations:
         assert cached['prediction'] == "REAL"
         assert cached['fake_probability'] == 0.2
     
+    def test_results_are_not_shared(self, cache_manager):
+        
+        text = "Sample news article shared between sessions"
+        result = {"prediction": "REAL", "cached": False}
+        
+        cache_manager.set(text, result)
+        first = cache_manager.get(text)
+        first["prediction"] = "FAKE"
+        second = cache_manager.get(text)
+        
+        assert result == {"prediction": "REAL", "cached": False}
+        assert second == {"prediction": "REAL", "cached": True}
+        assert first is not second
+    
     def test_get_nonexistent(self, cache_manager):
         
         cached = cache_manager.get("This text does not exist in cache")
@@ -61,6 +77,41 @@ class TestCacheBasicOperations:
         
         stats = cache_manager.stats()
         assert stats['hits'] >= 1
+    
+    def test_concurrent_set_and_get(self, cache_manager):
+        
+        texts = [f"Concurrent article {i}" for i in range(200)]
+        
+        def worker(chunk):
+            for text in chunk:
+                cache_manager.set(text, {"prediction": "REAL"})
+                assert cache_manager.get(text) is not None
+        
+        threads = [threading.Thread(target=worker, args=(texts[i::4],)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(cache_manager.cache) == len(texts)
+    
+    def test_hits_from_finished_threads_are_kept(self, cache_manager):
+        
+        cache_manager.set("Shared article", {"prediction": "FAKE"})
+        
+        def worker():
+            for _ in range(5):
+                assert cache_manager.get("Shared article") is not None
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        cache_manager.get("Shared article")
+        
+        assert cache_manager.stats()['hits'] == 21
 
 class TestCacheNormalization:
     
@@ -124,6 +175,7 @@ class TestCachePersistence:
     def test_save_to_file(self, temp_cache_file, cache_manager):
         
         cache_manager.set("Test", {"prediction": "REAL"})
+        cache_manager.flush()
         
         assert os.path.exists(temp_cache_file)
         
@@ -132,6 +184,54 @@ class TestCachePersistence:
         
         assert len(data) > 0
     
+    def test_writes_are_batched(self, temp_cache_file, cache_manager):
+        
+        cache_manager.set("Article 1", {"prediction": "REAL"})
+        cache_manager.set("Article 2", {"prediction": "FAKE"})
+        
+        assert os.path.getsize(temp_cache_file) == 0
+        
+        cache_manager.flush()
+        
+        with open(temp_cache_file, 'r') as f:
+            data = json.load(f)
+        
+        assert len(data) == 2
+    
+    def test_unflushed_entries_survive_reload(self, temp_cache_file, cache_manager):
+        
+        cache_manager.set("Logged article", {"prediction": "FAKE"})
+        
+        reloaded = CacheManager(cache_file=temp_cache_file)
+        cached = reloaded.get("Logged article")
+        
+        assert cached is not None
+        assert cached['prediction'] == "FAKE"
+        assert not os.path.exists(f"{temp_cache_file}.log")
+    
+    def test_log_synced_after_byte_threshold(self, cache_manager):
+        
+        cache_manager.LOG_SYNC_BYTES = 1
+        with patch('core.cache._fdatasync') as fdatasync:
+            cache_manager.set("Article 1", {"prediction": "REAL"})
+            cache_manager.set("Article 2", {"prediction": "FAKE"})
+        
+        assert fdatasync.call_count == 2
+    
+    def test_failed_save_keeps_previous_snapshot(self, temp_cache_file, cache_manager):
+        
+        cache_manager.set("Saved article", {"prediction": "REAL"})
+        cache_manager.flush()
+        
+        cache_manager.set("Unsaved article", {"prediction": "FAKE"})
+        with patch('core.cache.os.replace', side_effect=OSError("disk full")):
+            cache_manager.flush()
+        
+        with open(temp_cache_file, 'r') as f:
+            data = json.load(f)
+        
+        assert len(data) == 1
+    
     def test_load_from_file(self, temp_cache_file):
         
         test_data = {
@@ -220,6 +320,18 @@ class TestCacheRecentEntries:
         assert len(recent) == 3
         assert all('key' in entry for entry in recent)
         assert all('timestamp' in entry for entry in recent)
+    
+    def test_recent_entries_newest_first(self, cache_manager):
+        
+        for i in range(5):
+            text = f"Article {i}"
+            cache_manager.set(text, {"prediction": "REAL"})
+            key = cache_manager._generate_key(text)
+            cache_manager._shards[cache_manager._shard_index(key)][key]['timestamp'] = f"2024-01-0{i + 1}T00:00:00"
+        
+        recent = cache_manager.get_recent_entries(limit=2)
+        
+        assert [entry['preview'] for entry in recent] == ["Article 4", "Article 3"]
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
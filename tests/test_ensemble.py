@@ -4,6 +4,7 @@ import pytest
 import sys
 import os
 import asyncio
+import dataclasses
 from unittest.mock import Mock, AsyncMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.config import Config
 from core.ensemble import EnsemblePredictor
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     
     return Config(
@@ -28,7 +29,7 @@ def config():
         min_confidence=0.6
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_with_keys():
     
     return Config(
@@ -64,6 +65,17 @@ class TestEnsembleInitialization:
         
         assert 'heuristic' in active_models
         assert len(active_models) == 1
+    
+    def test_active_models_follow_key_changes(self, config_with_keys):
+        
+        config = dataclasses.replace(config_with_keys)
+        config.get_active_models().append("unknown")
+        
+        assert config.get_active_models() == ["heuristic", "huggingface", "gemini", "groq"]
+        
+        config.gemini_api_key = ""
+        
+        assert config.get_active_models() == ["heuristic", "huggingface", "groq"]
 
 class TestVerdictDetermination:
     
@@ -208,6 +220,93 @@ class TestPredictionFlow:
         
         assert result['fake_probability'] >= 0.3
 
+    @pytest.mark.asyncio
+    async def test_models_run_concurrently(self, config_with_keys):
+        
+        ensemble = EnsemblePredictor(config_with_keys)
+        
+        def slow_prediction(model_name):
+            async def predict(text):
+                await asyncio.sleep(0.2)
+                return {"model_name": model_name, "fake_probability": 0.5, "confidence": 0.8}
+            return predict
+        
+        ensemble.hf_client.is_available = Mock(return_value=True)
+        ensemble.hf_client.predict = slow_prediction("huggingface")
+        ensemble.gemini_client.predict = slow_prediction("gemini")
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await ensemble._run_models_parallel("Sample article text for concurrency.")
+        elapsed = loop.time() - start
+        
+        assert [r["model_name"] for r in results] == ["heuristic", "huggingface", "gemini"]
+        assert elapsed < 0.35
+
+    @pytest.mark.asyncio
+    async def test_cancelled_model_is_skipped(self, config_with_keys):
+        
+        ensemble = EnsemblePredictor(config_with_keys)
+        
+        async def cancelled_prediction(text):
+            future = asyncio.get_running_loop().create_future()
+            future.cancel()
+            return await future
+        
+        ensemble.hf_client.is_available = Mock(return_value=True)
+        ensemble.hf_client.predict = cancelled_prediction
+        ensemble.gemini_client.predict = AsyncMock(return_value={
+            "model_name": "gemini", "fake_probability": 0.5, "confidence": 0.8
+        })
+        
+        result = await ensemble.predict("Sample article text for a cancelled model.")
+        
+        assert result['models_used'] == ["heuristic", "gemini"]
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_overlaps_other_models(self, config_with_keys):
+        
+        ensemble = EnsemblePredictor(config_with_keys)
+        
+        async def failing_gemini(text):
+            raise RuntimeError("Gemini unavailable")
+        
+        async def slow_prediction(text, model_name):
+            await asyncio.sleep(0.2)
+            return {"model_name": model_name, "fake_probability": 0.5, "confidence": 0.8}
+        
+        ensemble.hf_client.is_available = Mock(return_value=True)
+        ensemble.hf_client.predict = lambda text: slow_prediction(text, "huggingface")
+        ensemble.gemini_client.predict = failing_gemini
+        ensemble.groq_client.predict = lambda text: slow_prediction(text, "groq")
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await ensemble._run_models_parallel("Sample article text for concurrency.")
+        elapsed = loop.time() - start
+        
+        assert [r["model_name"] for r in results] == ["heuristic", "huggingface", "groq"]
+        assert elapsed < 0.35
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_one_llm_request(self, config_with_keys):
+        
+        ensemble = EnsemblePredictor(dataclasses.replace(config_with_keys, llm_batching=True))
+        
+        texts = ["First sample article text.", "Second sample article text."]
+        ensemble.gemini_client.predict = AsyncMock()
+        ensemble.gemini_client.predict_batch = AsyncMock(return_value=[
+            {"model_name": "gemini", "fake_probability": 0.9, "confidence": 0.9},
+            {"model_name": "gemini", "fake_probability": 0.1, "confidence": 0.9}
+        ])
+        
+        results = await ensemble.predict_batch(texts)
+        
+        ensemble.gemini_client.predict_batch.assert_awaited_once_with(texts)
+        ensemble.gemini_client.predict.assert_not_awaited()
+        assert len(results) == 2
+        assert results[0]['fake_probability'] > results[1]['fake_probability']
+
 class TestSystemHealth:
     
     
@@ -253,6 +352,25 @@ class TestWeightedAveraging:
         result = ensemble._aggregate_results(model_results)
         
         assert 0.5 <= result['fake_probability'] <= 0.7
+    
+    def test_single_model_passthrough(self, ensemble):
+        
+        model_results = [{
+            "model_name": "heuristic",
+            "fake_probability": 0.82,
+            "confidence": 0.9,
+            "processing_time": 0.01,
+            "indicators": {"clickbait": 0.8},
+            "indicator_details": []
+        }]
+        
+        result = ensemble._aggregate_results(model_results)
+        
+        assert result['fake_probability'] == 0.82
+        assert result['confidence'] == 0.9
+        assert result['models_used'] == ["heuristic"]
+        assert result['model_scores'][0]['weight'] == 1.0
+        assert result['indicators'] == {"clickbait": 0.8}
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
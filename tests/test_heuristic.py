@@ -31,6 +31,22 @@ class TestEmotionalLanguage:
         
         assert result['indicators']['emotional_language'] >= 0.2
     
+    def test_hyphenated_emotional_word(self, analyzer):
+        
+        text = "Officials described the jaw-dropping figures released this morning."
+        result = analyzer.analyze(text)
+        
+        emotional = result['indicator_details'][0]
+        assert "jaw-dropping" in emotional['matches']
+    
+    def test_words_next_to_unicode_punctuation(self, analyzer):
+        
+        text = "Officials called the report \u201cshocking\u201d and a conspiracy\u2014nothing more, they said."
+        result = analyzer.analyze(text)
+        
+        emotional = result['indicator_details'][0]
+        assert {"shocking", "conspiracy"} <= set(emotional['matches'])
+    
     def test_mixed_emotional_text(self, analyzer):
         
         text = "In a surprising turn of events, the amazing discovery was announced."
@@ -109,6 +125,15 @@ class TestCapsRatio:
         result = analyzer.analyze(text)
         
         assert result['indicators']['caps_ratio'] > 0
+    
+    def test_long_text_caps_words(self, analyzer):
+        
+        text = "The FBI and NASA_X said ABC1 was URGENT. " * 80
+        result = analyzer.analyze(text)
+        
+        caps = next(d for d in result['indicator_details'] if d['name'] == "ALL CAPS Usage")
+        assert caps['matches'] == ["FBI", "URGENT", "FBI", "URGENT", "FBI"]
+        assert "160 ALL CAPS words" in caps['description']
 
 class TestOverallAnalysis:
     
@@ -152,6 +177,31 @@ class TestOverallAnalysis:
         
         assert result['fake_probability'] == 0.0
     
+    def test_short_text_skips_indicators(self, analyzer):
+        
+        result = analyzer.analyze("SHOCKING NEWS!!!")
+        
+        assert result['fake_probability'] == 0.5
+        assert result['confidence'] == 0.3
+        assert result['indicator_details'] == []
+    
+    def test_long_text_is_truncated(self, analyzer):
+        
+        text = "Normal reporting sentence. " * 1000 + "SHOCKING!!! " * 100
+        result = analyzer.analyze(text)
+        
+        assert result['indicators']['excessive_punctuation'] < 0.5
+    
+    def test_repeated_text_served_from_cache(self, analyzer):
+        
+        text = "SHOCKING news you won't believe about the election results!!!"
+        first = analyzer.analyze(text)
+        second = analyzer.analyze(text)
+        
+        assert second['processing_time'] == 0.0
+        assert second['fake_probability'] == first['fake_probability']
+        assert second['indicator_details'] == first['indicator_details']
+    
     def test_indicator_details_structure(self, analyzer):
         
         text = "Sample article with some shocking claims!"
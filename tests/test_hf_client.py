@@ -0,0 +1,81 @@
+
+
+import pytest
+import sys
+import os
+import asyncio
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.hf_client import HuggingFaceClient
+
+@pytest.fixture
+def client():
+    
+    return HuggingFaceClient(api_key="test-key")
+
+class TestSkippedInputs:
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", ["", "   short ", "https://example.com/news/article", "12,345.67 -- 89%"])
+    async def test_non_content_skips_api(self, client, text):
+        
+        result = await client.predict(text)
+        
+        assert result["confidence"] == 0.0
+        assert result["sentiment"] == "unknown"
+        assert client.usage_today == 0
+        assert client._queue is None
+
+class TestBatchDispatch:
+    
+    @pytest.mark.asyncio
+    async def test_batches_overlap_in_flight(self, client):
+        
+        in_flight = 0
+        peak = 0
+        
+        async def fake_request(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.1)
+            in_flight -= 1
+            return [[{"label": "positive", "score": 1.0}] for _ in texts]
+        
+        client._make_request = fake_request
+        texts = [f"news article number {index}" for index in range(3 * client.BATCH_SIZE)]
+        
+        start = time.monotonic()
+        results = await asyncio.gather(*(client.predict(text) for text in texts))
+        elapsed = time.monotonic() - start
+        client.close()
+        
+        assert all(result["sentiment"] == "positive" for result in results)
+        assert peak > 1
+        assert elapsed < 0.25
+
+class TestEventLoopChange:
+    
+    def test_worker_from_previous_loop_is_cancelled(self, client):
+        
+        async def start_worker():
+            client._get_queue()
+            return client._worker
+        
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            old_worker = asyncio.run_coroutine_threadsafe(start_worker(), old_loop).result(timeout=1)
+            new_worker = asyncio.run(start_worker())
+            time.sleep(0.05)
+            
+            assert new_worker is not old_worker
+            assert old_worker.cancelled()
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(timeout=1)
+            old_loop.close()
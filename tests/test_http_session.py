@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+import asyncio
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import http_session
+
+@pytest.fixture
+def background_loop():
+    
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=1)
+    loop.close()
+
+async def open_session():
+    
+    return http_session.get_session()
+
+class TestSharedSession:
+    
+    def test_reused_within_loop(self):
+        
+        async def open_twice():
+            first = http_session.get_session()
+            second = http_session.get_session()
+            await http_session.close_session()
+            return first, second
+        
+        first, second = asyncio.run(open_twice())
+        
+        assert first is second
+        assert first.closed
+    
+    def test_session_from_previous_loop_is_closed(self, background_loop):
+        
+        old_session = asyncio.run_coroutine_threadsafe(open_session(), background_loop).result(timeout=1)
+        
+        async def replace():
+            session = http_session.get_session()
+            await asyncio.sleep(0)
+            await http_session.close_session()
+            return session
+        
+        new_session = asyncio.run(replace())
+        time.sleep(0.05)
+        
+        assert new_session is not old_session
+        assert old_session.closed
+    
+    def test_session_from_closed_loop_is_closed(self):
+        
+        old_session = asyncio.run(open_session())
+        
+        async def replace():
+            session = http_session.get_session()
+            await asyncio.sleep(0)
+            await http_session.close_session()
+            return session
+        
+        new_session = asyncio.run(replace())
+        
+        assert new_session is not old_session
+        assert old_session.closed
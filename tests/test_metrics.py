@@ -0,0 +1,130 @@
+
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.metrics import MetricsTracker
+
+@pytest.fixture
+def tracker():
+    
+    return MetricsTracker(max_predictions=10)
+
+class TestLatencyPercentiles:
+    
+    
+    def test_empty_tracker(self, tracker):
+        
+        assert tracker.get_latency_percentiles() == {"p50": 0, "p95": 0, "p99": 0}
+    
+    def test_linear_interpolation(self, tracker):
+        
+        for latency in (0.4, 0.1, 0.3, 0.2):
+            tracker.record_prediction({"processing_time": latency})
+        
+        percentiles = tracker.get_latency_percentiles()
+        
+        assert percentiles["p50"] == 0.25
+        assert percentiles["p95"] == 0.385
+    
+    def test_only_recent_predictions_counted(self, tracker):
+        
+        for _ in range(10):
+            tracker.record_prediction({"processing_time": 100.0})
+        for _ in range(10):
+            tracker.record_prediction({"processing_time": 1.0})
+        
+        assert tracker.get_latency_percentiles()["p99"] == 1.0
+
+class TestRecordedPredictions:
+    
+    
+    def test_recent_predictions_newest_first(self, tracker):
+        
+        for index in range(12):
+            tracker.record_prediction(
+                {"prediction": "FAKE" if index % 2 else "REAL", "confidence": index / 20, "models_used": ["heuristic"]},
+                text=f"article {index}"
+            )
+        
+        recent = tracker.get_recent_predictions(limit=3)
+        
+        assert [r["text_preview"] for r in recent] == ["article 11", "article 10", "article 9"]
+        assert [r["prediction"] for r in recent] == ["FAKE", "REAL", "FAKE"]
+        assert recent[0]["confidence"] == 0.55
+        assert len(tracker) == 10
+        assert tracker.get_model_usage() == {"heuristic": 10}
+    
+    def test_stats_counts(self, tracker):
+        
+        tracker.record_prediction({"prediction": "FAKE", "confidence": 0.9, "cached": True})
+        tracker.record_prediction({"prediction": "REAL", "confidence": 0.7})
+        tracker.record_prediction({"prediction": "UNKNOWN", "confidence": 0.5})
+        
+        stats = tracker.get_prediction_stats()
+        
+        assert stats["fake_count"] == 1
+        assert stats["real_count"] == 1
+        assert stats["uncertain_count"] == 1
+        assert stats["avg_confidence"] == 0.7
+        assert stats["cache_hit_rate"] == 33.3
+    
+    def test_avg_confidence_covers_window_only(self, tracker):
+        
+        for _ in range(25):
+            tracker.record_prediction({"confidence": 0.1})
+        for _ in range(5):
+            tracker.record_prediction({"confidence": 0.9})
+        
+        assert tracker.get_prediction_stats()["avg_confidence"] == 0.5
+    
+    def test_model_usage_drops_evicted_models(self, tracker):
+        
+        for _ in range(10):
+            tracker.record_prediction({"models_used": ["groq", "heuristic"]})
+        for _ in range(10):
+            tracker.record_prediction({"models_used": ["heuristic"]})
+        
+        assert tracker.get_model_usage() == {"heuristic": 10}
+
+class TestHistograms:
+    
+    
+    def test_confidence_histogram_tracks_window(self, tracker):
+        
+        for _ in range(10):
+            tracker.record_prediction({"confidence": 0.05})
+        for _ in range(4):
+            tracker.record_prediction({"confidence": 1.0})
+        
+        counts, edges = tracker.get_confidence_histogram()
+        
+        assert len(edges) == len(counts) + 1
+        assert counts[0] == 6
+        assert counts[-1] == 4
+        assert counts.sum() == len(tracker)
+    
+    def test_latency_histogram_clamps_outliers(self, tracker):
+        
+        tracker.record_prediction({"processing_time": 0.0})
+        tracker.record_prediction({"processing_time": 1000.0})
+        
+        counts, _ = tracker.get_latency_histogram()
+        
+        assert counts[0] == 1
+        assert counts[-1] == 1
+
+class TestRecentErrors:
+    
+    
+    def test_newest_first_with_severity_filter(self):
+        
+        tracker = MetricsTracker(max_errors=5)
+        for index in range(7):
+            tracker.record_error(ValueError(f"error {index}"), "test", severity="WARNING" if index % 2 else "ERROR")
+        
+        assert [e["message"] for e in tracker.get_recent_errors(limit=2)] == ["error 6", "error 5"]
+        assert [e["message"] for e in tracker.get_recent_errors(severity="WARNING")] == ["error 5", "error 3"]
@@ -0,0 +1,69 @@
+
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rate_limiter import ClientTokenBucket
+
+class TestRateAdjustment:
+    
+    def test_decrease_halves_rate(self):
+        
+        bucket = ClientTokenBucket(rate=4.0, capacity=2)
+        bucket.decrease()
+        assert bucket.rate == 2.0
+    
+    def test_decrease_respects_floor(self):
+        
+        bucket = ClientTokenBucket(rate=4.0, capacity=2, min_rate=1.5)
+        for _ in range(5):
+            bucket.decrease()
+        assert bucket.rate == 1.5
+    
+    def test_decrease_without_drain_keeps_tokens(self):
+        
+        bucket = ClientTokenBucket(rate=4.0, capacity=2)
+        bucket.decrease(drain=False)
+        assert bucket.tokens == 2.0
+    
+    def test_increase_capped_at_max_rate(self):
+        
+        bucket = ClientTokenBucket(rate=4.0, capacity=2)
+        bucket.decrease()
+        for _ in range(50):
+            bucket.increase()
+        assert bucket.rate == 4.0
+
+class TestAcquire:
+    
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        
+        bucket = ClientTokenBucket(rate=1.0, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_refill(self):
+        
+        bucket = ClientTokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+    
+    @pytest.mark.asyncio
+    async def test_wait_beyond_budget_is_refused(self):
+        
+        bucket = ClientTokenBucket(rate=0.25, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        assert await bucket.acquire(max_wait=1.0) is False
+        assert time.monotonic() - start < 0.1
+        assert bucket.tokens < 1
@@ -1,8 +1,55 @@
 
 
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Union
 import json
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+VERDICT_COLORS = {
+    'FAKE': {
+        'bg': '#fee2e2',
+        'border': '#ef4444',
+        'text': '#991b1b',
+        'icon': '❌'
+    },
+    'REAL': {
+        'bg': '#d1fae5',
+        'border': '#10b981',
+        'text': '#065f46',
+        'icon': '✅'
+    },
+    'UNCERTAIN': {
+        'bg': '#fef3c7',
+        'border': '#f59e0b',
+        'text': '#92400e',
+        'icon': '⚠️'
+    }
+}
+
+SEVERITY_COLORS = {
+    'LOW': '#10b981',
+    'MEDIUM': '#f59e0b',
+    'HIGH': '#ef4444'
+}
+
+DEFAULT_SEVERITY_COLOR = '#6b7280'
+
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+PERCENT_STRINGS = tuple(f"{percent}%" for percent in range(101))
+
+MODEL_DISPLAY_NAMES = {
+    'heuristic': '🔍 Heuristic Analyzer',
+    'huggingface': '🤗 HuggingFace RoBERTa',
+    'together': '🦙 Together.ai Llama'
+}
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     
@@ -30,29 +77,37 @@ def format_timestamp(
     
     return str(timestamp)
 
-def format_relative_time(timestamp: datetime) -> str:
+@lru_cache(maxsize=256)
+def _iso_to_epoch(timestamp: str) -> Optional[float]:
     
-    if not isinstance(timestamp, datetime):
-        try:
-            timestamp = datetime.fromisoformat(str(timestamp))
-        except (ValueError, TypeError):
-            return "Unknown"
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return None
+
+def format_relative_time(timestamp: Union[datetime, float, str]) -> str:
     
-    now = datetime.now()
-    diff = now - timestamp
+    if isinstance(timestamp, datetime):
+        epoch = timestamp.timestamp()
+    elif isinstance(timestamp, (int, float)):
+        epoch = timestamp
+    else:
+        epoch = _iso_to_epoch(str(timestamp))
+        if epoch is None:
+            return "Unknown"
     
-    seconds = diff.total_seconds()
+    seconds = int(time.time() - epoch)
     
     if seconds < 60:
         return "Just now"
     elif seconds < 3600:
-        minutes = int(seconds / 60)
+        minutes = seconds // 60
         return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
     elif seconds < 86400:
-        hours = int(seconds / 3600)
+        hours = seconds // 3600
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
     else:
-        days = int(seconds / 86400)
+        days = seconds // 86400
         return f"{days} day{'s' if days != 1 else ''} ago"
 
 def format_percentage(value: float, decimal_places: int = 1) -> str:
@@ -66,7 +121,7 @@ def format_probability(value: float) -> str:
     elif value > 0.99:
         return ">99%"
     else:
-        return f"{value * 100:.0f}%"
+        return PERCENT_STRINGS[round(value * 100)]
 
 def format_latency(seconds: float) -> str:
     
@@ -79,54 +134,27 @@ def format_latency(seconds: float) -> str:
 
 def format_file_size(bytes_count: int) -> str:
     
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_count < 1024:
-            return f"{bytes_count:.1f} {unit}"
-        bytes_count /= 1024
-    return f"{bytes_count:.1f} TB"
+    index = min(max((int(bytes_count).bit_length() - 1) // 10, 0), len(FILE_SIZE_UNITS) - 1)
+    return f"{bytes_count / (1 << (10 * index)):.1f} {FILE_SIZE_UNITS[index]}"
 
 def format_verdict_color(prediction: str) -> dict:
     
-    colors = {
-        'FAKE': {
-            'bg': '#fee2e2',
-            'border': '#ef4444',
-            'text': '#991b1b',
-            'icon': '❌'
-        },
-        'REAL': {
-            'bg': '#d1fae5',
-            'border': '#10b981',
-            'text': '#065f46',
-            'icon': '✅'
-        },
-        'UNCERTAIN': {
-            'bg': '#fef3c7',
-            'border': '#f59e0b',
-            'text': '#92400e',
-            'icon': '⚠️'
-        }
-    }
-    return colors.get(prediction, colors['UNCERTAIN'])
+    return VERDICT_COLORS.get(prediction, VERDICT_COLORS['UNCERTAIN'])
 
 def format_severity_color(severity: str) -> str:
     
-    colors = {
-        'LOW': '#10b981',
-        'MEDIUM': '#f59e0b',
-        'HIGH': '#ef4444'
-    }
-    return colors.get(severity, '#6b7280')
+    return SEVERITY_COLORS.get(severity, DEFAULT_SEVERITY_COLOR)
 
 def result_to_json(result: dict, indent: int = 2) -> str:
     
+    if ORJSON_AVAILABLE and indent == 2:
+        return orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
     return json.dumps(result, indent=indent, default=str)
 
 def format_model_name(name: str) -> str:
     
-    names = {
-        'heuristic': '🔍 Heuristic Analyzer',
-        'huggingface': '🤗 HuggingFace RoBERTa',
-        'together': '🦙 Together.ai Llama'
-    }
-    return names.get(name, name.title())
+    return MODEL_DISPLAY_NAMES.get(name, name.title())
@@ -1,21 +1,25 @@
 
 
 import re
+from functools import lru_cache
 from typing import Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+@lru_cache(maxsize=32)
 def validate_text_length(
     text: str,
     min_length: int = 50,
     max_length: int = 5000
 ) -> Tuple[bool, str]:
     
-    if not text or not text.strip():
+    text = text.strip() if text else ""
+    if not text:
         return False, "Please enter some text to analyze."
     
-    text = text.strip()
     length = len(text)
     
     if length < min_length:
@@ -35,9 +39,7 @@ def validate_url(url: str) -> Tuple[bool, str]:
     
     url = url.strip()
     
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    
-    if re.match(pattern, url, re.IGNORECASE):
+    if URL_PATTERN.match(url):
         return True, "✓ Valid URL"
     else:
         return False, "Please enter a valid URL (starting with http:// or https://)"
@@ -57,6 +59,7 @@ def validate_source_name(source: str) -> Tuple[bool, str]:
     
     return True, "✓ Valid source"
 
+@lru_cache(maxsize=32)
 def get_character_count_display(text: str, max_length: int = 5000) -> Tuple[str, str]:
     
     length = len(text) if text else 0
@@ -82,9 +85,10 @@ def sanitize_text(text: str) -> str:
     
     text = ' '.join(text.split())
     
-    text = ''.join(
-        char for char in text
-        if char.isprintable() or char in '\n\t'
-    )
+    if not text.isprintable():
+        text = ''.join(
+            char for char in text
+            if char.isprintable() or char in '\n\t'
+        )
     
     return text.strip()